@@ -22,9 +22,10 @@ if os.path.exists(requirements_path):
 else:
     # Enhanced requirements with new dependencies
     requirements = [
-        "streamlit>=1.28.0",
+        "streamlit>=1.37.0",
         "requests>=2.31.0",
         "fuzzywuzzy>=0.18.0",
+        "rapidfuzz>=3.0.0",
         "python-levenshtein>=0.21.0",
         "click>=8.0.0",
         "pandas>=1.5.0",
@@ -97,6 +98,7 @@ setup(
         ],
     },
     include_package_data=True,
+    package_data={"name_address_validator": ["static/*.css"]},
     zip_safe=False,
     keywords=[
         "address validation",
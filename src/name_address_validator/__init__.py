@@ -2,12 +2,9 @@
 __version__ = "1.1.0"
 
 try:
-    from .services.validation_service import ValidationService
+    from .services import ValidationService
 except ImportError:
-    try:
-        from .services.validation_service_working import ValidationService
-    except ImportError:
-        ValidationService = None
+    ValidationService = None
 
 try:
     from .utils.config import load_usps_credentials
@@ -6,16 +6,36 @@ Now supports both name-only validation and address validation workflows
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import io
+import html
+import hashlib
+import importlib.util
 import time
 import sys
 import os
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, List
 from pathlib import Path
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Enhanced Python path setup (same as original)
 def setup_python_path():
+    # Nothing to probe when the package is already importable (installed or on sys.path)
+    if importlib.util.find_spec("name_address_validator") is not None:
+        return None
+    
     current_file = Path(__file__).resolve()
     potential_src = current_file.parent.parent
     if potential_src.name == "src" and (potential_src / "name_address_validator").exists():
@@ -34,21 +54,25 @@ def setup_python_path():
     
     return None
 
+# Reruns re-execute this script but find the package already in sys.modules,
+# so path setup and the import banner only happen on the first run
+first_load = "name_address_validator.services.validation_service" not in sys.modules
+
 # Setup path before importing
-print("🔧 Setting up Python path...")
-setup_result = setup_python_path()
+if first_load:
+    print("🔧 Setting up Python path...")
+    setup_result = setup_python_path()
 
 # Try imports
 try:
-    print("📦 Attempting to import enhanced validation service...")
+    if first_load:
+        print("📦 Attempting to import enhanced validation service...")
     from name_address_validator.services.validation_service import EnhancedValidationService
-    print("✅ Enhanced EnhancedValidationService imported successfully")
-    
     from name_address_validator.utils.config import load_usps_credentials
-    from name_address_validator.utils.logger import DebugLogger
     
     imports_successful = True
-    print("🎉 All enhanced imports successful!")
+    if first_load:
+        print("🎉 All enhanced imports successful!")
     
 except ImportError as e:
     print(f"❌ Import Error: {e}")
@@ -61,11 +85,15 @@ except ImportError as e:
 if not imports_successful:
     st.stop()
 
+# Echo debug logs to the server console (off by default; set NAV_CONSOLE_DEBUG=1 to turn on)
+CONSOLE_DEBUG = os.environ.get("NAV_CONSOLE_DEBUG", "0") == "1"
+
 # Debug and Monitoring System (same as original)
 class DebugMonitor:
     def __init__(self):
         if 'debug_logs' not in st.session_state:
-            st.session_state.debug_logs = []
+            # Bounded buffer: the oldest entries drop off once 500 are held
+            st.session_state.debug_logs = deque(maxlen=500)
         if 'performance_metrics' not in st.session_state:
             st.session_state.performance_metrics = []
         if 'validation_stats' not in st.session_state:
@@ -80,18 +108,18 @@ class DebugMonitor:
             }
     
     def log(self, level: str, message: str, category: str = "GENERAL", **kwargs):
-        log_entry = {
-            'timestamp': datetime.now(),
-            'level': level.upper(),
-            'category': category.upper(),
+        timestamp_ns = time.time_ns()  # epoch ns; formatted only when displayed
+        level = level.upper()
+        category = category.upper()
+        st.session_state.debug_logs.append({
+            'timestamp': timestamp_ns,
+            'level': level,
+            'category': category,
             'message': message,
             'details': kwargs
-        }
-        st.session_state.debug_logs.append(log_entry)
-        if len(st.session_state.debug_logs) > 500:
-            st.session_state.debug_logs = st.session_state.debug_logs[-500:]
-        timestamp = log_entry['timestamp'].strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level.upper()} {category}: {message}")
+        })
+        if CONSOLE_DEBUG:
+            sys.stdout.write(f"[{datetime.fromtimestamp(timestamp_ns / 1e9):%H:%M:%S}] {level} {category}: {message}\n")
     
     def update_stats(self, stat_type: str, increment: int = 1):
         if stat_type in st.session_state.validation_stats:
@@ -100,345 +128,177 @@ class DebugMonitor:
 # Global debug monitor
 debug_monitor = DebugMonitor()
 
+def _service_log(message: str, category: str = "SERVICE"):
+    """Debug callback handed to the validation service"""
+    debug_monitor.log("INFO", message, category)
+
+@st.cache_resource(show_spinner=False)
+def get_validation_service() -> EnhancedValidationService:
+    """Shared validation service, built once per process and reused across reruns and sessions"""
+    return EnhancedValidationService(debug_callback=_service_log)
+
 # CSS Styling (enhanced with new validation type styling)
+APP_CSS_PATH = Path(__file__).resolve().parent / "static" / "app.css"
+
+APP_CSS_LINK = '<link rel="stylesheet" href="app/static/app.css">'
+
+@st.cache_resource
+def _css_payload(static_serving: bool) -> str:
+    """Build the stylesheet markup once per process (inline <style> when static serving is off)"""
+    if static_serving:
+        # Served from static/ so the browser caches it across reruns and sessions
+        return APP_CSS_LINK
+    return f"<style>{APP_CSS_PATH.read_text(encoding='utf-8')}</style>"
+
 def apply_enhanced_enterprise_css():
     """Apply modern enterprise SaaS styling with enhanced multi-file support"""
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styles */
-    .main {
-        font-family: 'Inter', sans-serif;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        min-height: 100vh;
-    }
-    
-    /* Compact Header Styles */
-    .enterprise-header {
-        background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);
-        padding: 1.5rem 2rem;
-        border-radius: 16px;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        position: relative;
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        max-width: fit-content;
-        margin-left: auto;
-        margin-right: auto;
-    }
-    
-    .main-title {
-        font-size: 2.2rem;
-        font-weight: 700;
-        color: #ffffff;
-        text-align: center;
-        margin-bottom: 0.3rem;
-        letter-spacing: -0.025em;
-        white-space: nowrap;
-        line-height: 1.2;
-    }
-    
-    .subtitle {
-        font-size: 1rem;
-        color: #cbd5e1;
-        text-align: center;
-        font-weight: 400;
-        margin-bottom: 0.5rem;
-        white-space: nowrap;
-        opacity: 0.9;
-    }
-    
-    .api-status {
-        background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);
-        color: #ffffff;
-        padding: 0.5rem 1.2rem;
-        border-radius: 25px;
-        font-weight: 600;
-        font-size: 0.8rem;
-        text-align: center;
-        margin-top: 0.5rem;
-        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);
-        border: 2px solid #60a5fa;
-        animation: pulse-glow 2s infinite;
-        white-space: nowrap;
-    }
-    
-    .api-status.error {
-        background: linear-gradient(135deg, #991b1b 0%, #dc2626 100%);
-        border: 2px solid #ef4444;
-        box-shadow: 0 4px 12px rgba(239, 68, 68, 0.3);
-    }
-    
-    @keyframes pulse-glow {
-        0%, 100% { box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3); }
-        50% { box-shadow: 0 6px 20px rgba(59, 130, 246, 0.5); }
-    }
-    
-    /* Card and other styles */
-    .glass-card {
-        background: rgba(255, 255, 255, 0.95);
-        backdrop-filter: blur(20px);
-        border-radius: 20px;
-        padding: 2rem;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        margin: 1rem 0;
-        transition: all 0.3s ease;
-    }
-    
-    .glass-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.15);
-    }
-    
-    .section-header {
-        font-size: 1.4rem;
-        font-weight: 600;
-        color: #1e40af;
-        margin-bottom: 1.2rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid #e2e8f0;
-        position: relative;
-        display: inline-block;
-        width: auto;
-        min-width: fit-content;
-    }
-    
-    .section-header::after {
-        content: '';
-        position: absolute;
-        bottom: -2px;
-        left: 0;
-        width: 100%;
-        height: 2px;
-        background: linear-gradient(90deg, #3b82f6, #8b5cf6);
-        border-radius: 1px;
-    }
-    
-    /* Status Messages */
-    .status-success {
-        background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%);
-        border: 1px solid #86efac;
-        color: #065f46;
-        padding: 1rem;
-        border-radius: 12px;
-        margin: 0.5rem 0;
-        font-weight: 500;
-        display: flex;
-        align-items: center;
-        box-shadow: 0 4px 6px rgba(16, 185, 129, 0.1);
-    }
-    
-    .status-error {
-        background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%);
-        border: 1px solid #fca5a5;
-        color: #991b1b;
-        padding: 1rem;
-        border-radius: 12px;
-        margin: 0.5rem 0;
-        font-weight: 500;
-        display: flex;
-        align-items: center;
-        box-shadow: 0 4px 6px rgba(239, 68, 68, 0.1);
-    }
-    
-    .status-warning {
-        background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%);
-        border: 1px solid #fed7aa;
-        color: #92400e;
-        padding: 1rem;
-        border-radius: 12px;
-        margin: 0.5rem 0;
-        font-weight: 500;
-        display: flex;
-        align-items: center;
-        box-shadow: 0 4px 6px rgba(245, 158, 11, 0.1);
-    }
-    
-    .status-info {
-        background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%);
-        border: 1px solid #93c5fd;
-        color: #1e40af;
-        padding: 1rem;
-        border-radius: 12px;
-        margin: 0.5rem 0;
-        font-weight: 500;
-        display: flex;
-        align-items: center;
-        box-shadow: 0 4px 6px rgba(59, 130, 246, 0.1);
-    }
-    
-    /* Metrics Cards */
-    .metric-card {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        border: 1px solid #e2e8f0;
-        border-radius: 16px;
-        padding: 1.5rem;
-        text-align: center;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.05);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #3b82f6, #8b5cf6, #ec4899);
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Button Styles */
-    .stButton > button {
-        background: linear-gradient(135deg, #3b82f6 0%, #8b5cf6 100%);
-        color: white;
-        border: none;
-        border-radius: 12px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 14px rgba(59, 130, 246, 0.3);
-        text-transform: none;
-        letter-spacing: 0.025em;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(59, 130, 246, 0.4);
-        background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
-    }
-    
-    .stButton > button:disabled {
-        background: linear-gradient(135deg, #9ca3af 0%, #6b7280 100%);
-        cursor: not-allowed;
-        transform: none;
-        box-shadow: none;
-    }
-    
-    /* Progress Bar */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #3b82f6, #8b5cf6, #ec4899);
-    }
-    
-    /* Tab Styles */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0;
-        background: rgba(255, 255, 255, 0.9);
-        border-radius: 16px;
-        padding: 6px;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-        backdrop-filter: blur(20px);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        margin-bottom: 1.5rem;
-        justify-content: center;
-        width: fit-content;
-        margin-left: auto;
-        margin-right: auto;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 48px;
-        background: transparent;
-        border-radius: 12px;
-        color: #64748b;
-        font-weight: 500;
-        border: none;
-        transition: all 0.3s ease;
-        margin: 0 2px;
-        padding: 0 1.5rem;
-        position: relative;
-        overflow: hidden;
-        min-width: 140px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 0.95rem;
-        cursor: pointer;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(59, 130, 246, 0.1);
-        color: #3b82f6;
-        transform: translateY(-1px);
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #3b82f6 0%, #8b5cf6 100%);
-        color: white;
-        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4);
-        transform: translateY(-2px);
-        font-weight: 600;
-    }
-    
-    /* Tab icons */
-    .stTabs [data-baseweb="tab"]:first-child::before {
-        content: "👤";
-        margin-right: 0.5rem;
-        font-size: 1rem;
-    }
-    
-    .stTabs [data-baseweb="tab"]:nth-child(2)::before {
-        content: "📊";
-        margin-right: 0.5rem;
-        font-size: 1rem;
-    }
-    
-    .stTabs [data-baseweb="tab"]:nth-child(3)::before {
-        content: "🔧";
-        margin-right: 0.5rem;
-        font-size: 1rem;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Data Frame Styling */
-    .stDataFrame {
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.05);
-    }
-    
-    /* Expander Styling */
-    .streamlit-expanderHeader {
-        background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%);
-        border-radius: 8px;
-        border: 1px solid #e2e8f0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_css_payload(st.get_option("server.enableStaticServing")), unsafe_allow_html=True)
+
+def render_file_breakdown_table(file_breakdown: Dict, count_key: str, count_label: str):
+    """Render per-file totals and rates as a single table"""
+    breakdown_df = pd.DataFrame.from_dict(file_breakdown, orient='index')
+    rates = breakdown_df['rate'].to_numpy(dtype=float)
+    rate_icons = pd.Series(np.select([rates > 0.8, rates > 0.5], ['🟢', '🟡'], default='🔴'))
+    rate_text = pd.Series(rates * 100).round(1).astype(str) + '%'
+    
+    st.dataframe(
+        pd.DataFrame({
+            'File': breakdown_df.index,
+            'Total': breakdown_df['total'].to_numpy(),
+            count_label: breakdown_df[count_key].to_numpy(),
+            'Rate': rate_icons + ' ' + rate_text
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+
+def records_to_dataframe(records: List[Dict]) -> pd.DataFrame:
+    """Build a DataFrame from result records using Arrow's C-level row conversion"""
+    if not PYARROW_AVAILABLE or not records:
+        return pd.DataFrame(records)
+    
+    # Optional columns (e.g. suggestions) appear on later records only, so build the union of
+    # keys and let Arrow infer each column's type from all of its values (ints and floats unify)
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    try:
+        return pa.table({col: pa.array([record.get(col) for record in records]) for col in columns}).to_pandas()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        # Mixed-type columns and ints beyond int64: let pandas fall back to object dtype
+        return pd.DataFrame(records)
+
+def shrink_dataframe(df: pd.DataFrame, category_ratio: float = 0.5) -> pd.DataFrame:
+    """Shrink dtypes in place: low-cardinality strings to category, numbers downcast"""
+    row_count = len(df)
+    if row_count == 0:
+        return df
+    
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            df[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            downcast = pd.to_numeric(series, downcast='float')
+            # float32 only when every value survives it exactly (0.1 and 123456.789 don't)
+            if np.array_equal(downcast.to_numpy(dtype=np.float64, na_value=np.nan),
+                              series.to_numpy(dtype=np.float64, na_value=np.nan), equal_nan=True):
+                df[col] = downcast
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            try:
+                if series.nunique(dropna=False) / row_count < category_ratio:
+                    df[col] = series.astype('category')
+            except TypeError:
+                pass  # unhashable values (lists/dicts) stay as objects
+    return df
+
+def dataframe_to_csv_bytes(df: pd.DataFrame, chunksize: int = 10_000) -> bytes:
+    """Serialize a DataFrame to UTF-8 CSV bytes, exactly as DataFrame.to_csv(index=False) writes it.
+    
+    Rows are formatted chunksize at a time, so only one chunk's text is built alongside the DataFrame.
+    """
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, chunksize=chunksize)
+    return buffer.getvalue().encode('utf-8')
+
+def dataframe_to_parquet_bytes(df: pd.DataFrame, metadata: Optional[Dict[bytes, bytes]] = None) -> bytes:
+    """Serialize a DataFrame to zstd-compressed Parquet, with optional extra schema metadata"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression='zstd')
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV download bytes, reused while the same frame is shown again (keyed on its content hash)"""
+    return dataframe_to_csv_bytes(df)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_parquet_bytes(df: pd.DataFrame, metadata: Optional[Dict[bytes, bytes]] = None) -> bytes:
+    """Parquet download bytes, reused while the same frame and metadata are shown again"""
+    return dataframe_to_parquet_bytes(df, metadata)
+
+def write_excel_sheet(writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str):
+    """Write a DataFrame to a new xlsxwriter sheet strictly row by row.
+    
+    DataFrame.to_excel emits cells column by column, which xlsxwriter's
+    constant_memory mode silently drops, so rows are written here instead.
+    """
+    worksheet = writer.book.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(col) for col in df.columns], writer.book.add_format({'bold': True}))
+    worksheet.freeze_panes(1, 0)
+    
+    # Python scalars with NaN as None (blank cell), matching to_excel's default na_rep
+    values = df.astype(object).where(df.notna(), None)
+    for row_number, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_number, 0, row)
+
+STATUS_ICONS = {"success": "✓", "error": "✗", "warning": "⚠", "info": "ℹ"}
 
 def display_status_message(message: str, status_type: str = "info"):
     """Display styled status messages"""
-    icons = {"success": "✓", "error": "✗", "warning": "⚠", "info": "ℹ"}
-    icon = icons.get(status_type, "ℹ")
-    st.markdown(f'<div class="status-{status_type}">{icon} {message}</div>', unsafe_allow_html=True)
+    st.markdown(f'<div class="status-{status_type}">{STATUS_ICONS.get(status_type, "ℹ")} {message}</div>', unsafe_allow_html=True)
+
+def render_metric_grid(metrics: List[Tuple[str, object]]):
+    """Render a row of metric tiles as one HTML block instead of a column + st.metric per value"""
+    tiles = ''.join(
+        f'<div class="metric-tile"><div class="metric-tile-label">{html.escape(str(label))}</div>'
+        f'<div class="metric-tile-value">{html.escape(str(value))}</div></div>'
+        for label, value in metrics
+    )
+    st.markdown(f'<div class="metric-grid">{tiles}</div>', unsafe_allow_html=True)
+
+SELECTOR_HEADER_HTML = '''
+<div class="glass-card">
+    <div class="section-header">Choose Validation Type</div>
+</div>
+
+Select the type of validation you want to perform on your uploaded CSV files:
+'''
+
+NAME_VALIDATION_BLURB = """
+**Intelligent Name Parsing & Validation**
+- Parse names from any format (Full Name, Last-First, etc.)
+- AI-powered name recognition and standardization
+- Validate against US Census name databases
+- Get suggestions for misspelled names
+- Export standardized first/last name data
+"""
+
+ADDRESS_VALIDATION_BLURB = """
+**Complete Address Validation & Standardization**
+- Parse combined addresses or use separate fields
+- US address qualification and USPS validation
+- Real-time deliverability verification
+- Address standardization and correction
+- Business/residential classification
+"""
 
 def render_validation_type_selector() -> str:
     """Render validation type selector and return selected option"""
-    st.markdown('''
-    <div class="glass-card">
-        <div class="section-header">Choose Validation Type</div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    st.markdown("Select the type of validation you want to perform on your uploaded CSV files:")
+    st.markdown(SELECTOR_HEADER_HTML, unsafe_allow_html=True)
     
     # Initialize session state for validation type
     if 'validation_type' not in st.session_state:
@@ -451,45 +311,97 @@ def render_validation_type_selector() -> str:
             st.session_state.validation_type = 'name_validation'
             st.rerun()
         
-        st.markdown("""
-        **Intelligent Name Parsing & Validation**
-        - Parse names from any format (Full Name, Last-First, etc.)
-        - AI-powered name recognition and standardization
-        - Validate against US Census name databases
-        - Get suggestions for misspelled names
-        - Export standardized first/last name data
-        """)
+        st.markdown(NAME_VALIDATION_BLURB)
     
     with col2:
         if st.button("🏠 Address Validation", type="primary" if st.session_state.validation_type == 'address_validation' else "secondary", use_container_width=True):
             st.session_state.validation_type = 'address_validation'
             st.rerun()
         
-        st.markdown("""
-        **Complete Address Validation & Standardization**
-        - Parse combined addresses or use separate fields
-        - US address qualification and USPS validation
-        - Real-time deliverability verification
-        - Address standardization and correction
-        - Business/residential classification
-        """)
+        st.markdown(ADDRESS_VALIDATION_BLURB)
     
     return st.session_state.validation_type
 
+def read_uploaded_csv(uploaded_file) -> pd.DataFrame:
+    """Parse an uploaded CSV, reusing the cached frame while the upload is unchanged"""
+    file_bytes = uploaded_file.getvalue()
+    # Key on the uploader's per-upload id so reruns don't re-hash the whole file
+    file_key = getattr(uploaded_file, 'file_id', None) or hashlib.sha256(file_bytes).hexdigest()
+    return _parse_csv_cached(file_key, uploaded_file.name, file_bytes)
+
+def read_uploaded_csvs(uploaded_files) -> List[Tuple[Optional[pd.DataFrame], Optional[Exception]]]:
+    """Parse several uploads concurrently; results come back in upload order"""
+    # Worker threads need the script context for cache_data and session state access
+    script_ctx = get_script_run_ctx()
+    
+    def parse(uploaded_file):
+        try:
+            return read_uploaded_csv(uploaded_file), None
+        except Exception as e:
+            return None, e
+    
+    # A single upload gains nothing from a pool; parse it on the script thread
+    if len(uploaded_files) == 1:
+        return [parse(uploaded_files[0])]
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files)),
+                            initializer=lambda: add_script_run_ctx(ctx=script_ctx)) as executor:
+        return list(executor.map(parse, uploaded_files))
+
+# Enough entries for a multi-file upload to stay cached across reruns; idle frames expire after an hour
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _parse_csv_cached(file_key: str, file_name: str, _file_bytes: bytes) -> pd.DataFrame:
+    """Parse CSV bytes, using PyArrow's multithreaded reader when available"""
+    file_bytes = _file_bytes
+    if PYARROW_AVAILABLE:
+        try:
+            read_options = pacsv.ReadOptions(block_size=1 << 20, use_threads=True)
+            table = pacsv.read_csv(pa.BufferReader(file_bytes), read_options=read_options,
+                                   convert_options=pacsv.ConvertOptions(strings_can_be_null=True))
+            # read_csv leaves dates and times as text, so re-read any column Arrow parsed as one
+            temporal_columns = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+            if temporal_columns:
+                table = pacsv.read_csv(pa.BufferReader(file_bytes), read_options=read_options,
+                                       convert_options=pacsv.ConvertOptions(
+                                           strings_can_be_null=True,
+                                           column_types={name: pa.string() for name in temporal_columns}
+                                       ))
+            # Binary columns mean non-UTF-8 input, and read_csv renames duplicate and blank
+            # headers (a.1, Unnamed: N); both cases are left to pandas
+            names = table.schema.names
+            if (not any(pa.types.is_binary(field.type) for field in table.schema)
+                    and len(set(names)) == len(names) and '' not in names):
+                # Plain NumPy-backed columns: the standardizers rely on str()/'nan' semantics.
+                # self_destruct frees each Arrow column as it is converted, so the file
+                # isn't held twice at peak
+                df = table.to_pandas(split_blocks=True, self_destruct=True)
+                del table
+                object_columns = df.columns[(df.dtypes == object).to_numpy()]
+                if len(object_columns) > 0:
+                    # Older pandas hands back None for null strings; match read_csv's NaN
+                    df[object_columns] = df[object_columns].where(df[object_columns].notna(), np.nan)
+                return df
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            debug_monitor.log("WARNING", f"PyArrow CSV read failed for {file_name}, using pandas: {str(e)}", "BULK_VALIDATION")
+    
+    return pd.read_csv(io.BytesIO(file_bytes))
+
 def render_enhanced_bulk_validation():
     """Enhanced bulk validation with validation type selection"""
     debug_monitor.log("INFO", "Rendering enhanced bulk validation with type selection", "UI")
     
+    # Section header, intro and upload heading in one element
     st.markdown('''
     <div class="glass-card">
         <div class="section-header">Enhanced Multi-File Processing</div>
     </div>
-    ''', unsafe_allow_html=True)
     
-    st.write("Upload multiple CSV files with various formats. Choose between name validation or address validation workflows.")
+    Upload multiple CSV files with various formats. Choose between name validation or address validation workflows.
+    
+    ### 📁 Upload CSV Files
+    ''', unsafe_allow_html=True)
     
     # File upload section
-    st.markdown("### 📁 Upload CSV Files")
     uploaded_files = st.file_uploader(
         "Choose CSV files",
         type=['csv'],
@@ -509,14 +421,14 @@ def render_enhanced_bulk_validation():
             # Display file list
             st.markdown("### 📋 Uploaded Files")
             
-            for i, uploaded_file in enumerate(uploaded_files):
-                try:
-                    df = pd.read_csv(uploaded_file)
+            parsed_files = read_uploaded_csvs(uploaded_files)
+            
+            for uploaded_file, (df, error) in zip(uploaded_files, parsed_files):
+                if error is None:
                     file_data_list.append((df, uploaded_file.name))
-                    total_rows += len(df)
-                    
-                except Exception as e:
-                    st.error(f"❌ Error reading {uploaded_file.name}: {str(e)}")
+                    total_rows += df.shape[0]  # counted once here and reused downstream
+                else:
+                    st.error(f"❌ Error reading {uploaded_file.name}: {str(error)}")
             
             if file_data_list:
                 display_status_message(f"Successfully loaded {len(file_data_list)} files with {total_rows} total records.", "success")
@@ -526,7 +438,7 @@ def render_enhanced_bulk_validation():
                 
                 # Show appropriate templates and instructions
                 if validation_type == 'name_validation':
-                    render_name_validation_section(file_data_list)
+                    render_name_validation_section(file_data_list, total_rows)
                 else:
                     render_address_validation_section(file_data_list)
             
@@ -537,32 +449,34 @@ def render_enhanced_bulk_validation():
             display_status_message(f"Error processing uploaded files: {str(e)}", "error")
             debug_monitor.log("ERROR", "Failed to process uploaded CSV files", "BULK_VALIDATION", error=str(e))
 
-def render_name_validation_section(file_data_list):
+# Static name template served by the download button (no DataFrame needed)
+NAME_TEMPLATE_CSV = (
+    b"full_name,customer_id,notes\n"
+    b"John Smith,CUST001,Primary contact\n"
+    b"Jane Doe,CUST002,Secondary contact\n"
+    b"Michael Johnson,CUST003,Manager\n"
+)
+
+@st.fragment
+def render_name_validation_section(file_data_list, total_rows: Optional[int] = None):
     """Render name validation specific section"""
     
     # Template section for names
     with st.expander("📄 Download Name Validation Templates & Format Guide"):
         st.write("**Name Template:**")
-        name_template_data = {
-            'full_name': ['John Smith', 'Jane Doe', 'Michael Johnson'],
-            'customer_id': ['CUST001', 'CUST002', 'CUST003'],
-            'notes': ['Primary contact', 'Secondary contact', 'Manager']
-        }
-        name_template_df = pd.DataFrame(name_template_data)
-        
-        csv_template = name_template_df.to_csv(index=False)
         st.download_button(
             label="📥 Download Name Template",
-            data=csv_template,
+            data=NAME_TEMPLATE_CSV,
             file_name="name_validation_template.csv",
             mime="text/csv",
             use_container_width=True
         )
         
-        st.write("**Supported Name Column Variations:**")
-        st.write("Our AI-powered parser automatically detects these column variations:")
-        
         name_variations_info = """
+        **Supported Name Column Variations:**
+        
+        Our AI-powered parser automatically detects these column variations:
+        
         - **Full Names**: full_name, name, fullname, complete_name, customer_name, person_name
         - **First Names**: first_name, first, fname, given_name, forename, firstname
         - **Last Names**: last_name, last, lname, surname, family_name, lastname
@@ -610,35 +524,34 @@ def render_name_validation_section(file_data_list):
                 generate_name_parsing_preview(file_data_list)
         else:
             if st.button("🚀 Complete Name Validation Pipeline", type="primary", use_container_width=True):
-                process_complete_name_pipeline(file_data_list, include_suggestions, max_records)
+                process_complete_name_pipeline(file_data_list, include_suggestions, max_records, total_rows)
+
+# Static address template served by the download button (no DataFrame needed)
+ADDRESS_TEMPLATE_CSV = (
+    b"first_name,last_name,street_address,city,state,zip_code\n"
+    b"John,Smith,1600 Pennsylvania Ave NW,Washington,DC,20500\n"
+    b"Jane,Doe,350 Fifth Avenue,New York,NY,10118\n"
+    b"Michael,Johnson,123 Main Street,Chicago,IL,60601\n"
+)
 
+@st.fragment
 def render_address_validation_section(file_data_list):
     """Render address validation specific section (existing functionality)"""
     
     # Template section for addresses
     with st.expander("📄 Download Address Validation Templates & Format Guide"):
         st.write("**Standard Address Template:**")
-        template_data = {
-            'first_name': ['John', 'Jane', 'Michael'],
-            'last_name': ['Smith', 'Doe', 'Johnson'],
-            'street_address': ['1600 Pennsylvania Ave NW', '350 Fifth Avenue', '123 Main Street'],
-            'city': ['Washington', 'New York', 'Chicago'],
-            'state': ['DC', 'NY', 'IL'],
-            'zip_code': ['20500', '10118', '60601']
-        }
-        template_df = pd.DataFrame(template_data)
-        
-        csv_template = template_df.to_csv(index=False)
         st.download_button(
             label="📥 Download Address Template",
-            data=csv_template,
+            data=ADDRESS_TEMPLATE_CSV,
             file_name="address_validation_template.csv",
             mime="text/csv",
             use_container_width=True
         )
         
-        st.write("**Supported Address Column Variations:**")
         address_variations_info = """
+        **Supported Address Column Variations:**
+        
         - **Names**: first_name, first, fname, given_name, last_name, last, lname, surname
         - **Address**: street_address, street, address, addr, address1, full_address
         - **City**: city, town, municipality, locality
@@ -683,19 +596,23 @@ def render_address_validation_section(file_data_list):
 
 # NAME VALIDATION PROCESSING FUNCTIONS
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def parse_names_cached(file_data_list: List[Tuple[pd.DataFrame, str]]) -> Tuple[Dict, Optional[Dict]]:
+    """Standardize and parse names, and build their preview, once per distinct set of uploaded frames"""
+    validation_service = get_validation_service()
+    parsing_result = validation_service.standardize_and_parse_names_from_csv(file_data_list)
+    preview_result = validation_service.generate_name_validation_preview(parsing_result) if parsing_result['success'] else None
+    return parsing_result, preview_result
+
 def generate_name_parsing_preview(file_data_list: List[Tuple[pd.DataFrame, str]]):
     """Generate name parsing preview"""
     debug_monitor.log("INFO", "Generating name parsing preview", "NAME_PARSING")
     
     try:
-        validation_service = EnhancedValidationService(debug_callback=lambda msg, cat="SERVICE": debug_monitor.log("INFO", msg, cat))
-        
         with st.spinner("🔄 Analyzing name formats, parsing names, and generating preview..."):
-            parsing_result = validation_service.standardize_and_parse_names_from_csv(file_data_list)
+            parsing_result, preview_result = parse_names_cached(file_data_list)
         
         if parsing_result['success']:
-            preview_result = validation_service.generate_name_validation_preview(parsing_result)
-            
             if preview_result['success']:
                 display_name_parsing_preview(preview_result, parsing_result)
             else:
@@ -707,6 +624,10 @@ def generate_name_parsing_preview(file_data_list: List[Tuple[pd.DataFrame, str]]
         display_status_message(f"Error generating name parsing preview: {str(e)}", "error")
         debug_monitor.log("ERROR", "Name parsing preview failed", "NAME_PARSING", error=str(e))
 
+# Columns shown in the preview sample tables
+VALID_NAME_SAMPLE_COLUMNS = ('first_name', 'last_name', 'middle_name', 'title', 'suffix', 'source_file')
+INVALID_NAME_SAMPLE_COLUMNS = ('first_name', 'last_name', 'name_quality_issues', 'source_file')
+
 def display_name_parsing_preview(preview_result: Dict, parsing_result: Dict):
     """Display name parsing preview results"""
     
@@ -747,33 +668,19 @@ def display_name_parsing_preview(preview_result: Dict, parsing_result: Dict):
     if file_breakdown:
         st.markdown("### 📁 Results by File")
         
-        for filename, stats in file_breakdown.items():
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-            with col1:
-                st.write(f"**{filename}**")
-            with col2:
-                st.write(f"{stats['total']} total")
-            with col3:
-                st.write(f"{stats['valid']} valid")
-            with col4:
-                rate_text = f"{stats['rate']:.1%}"
-                if stats['rate'] > 0.8:
-                    st.write(f"🟢 {rate_text}")
-                elif stats['rate'] > 0.5:
-                    st.write(f"🟡 {rate_text}")
-                else:
-                    st.write(f"🔴 {rate_text}")
+        render_file_breakdown_table(file_breakdown, 'valid', 'Valid')
     
     # Valid names preview
     if valid_preview['count'] > 0:
-        st.markdown(f"### ✅ Successfully Parsed Names ({valid_preview['count']} total)")
-        st.write("These names were successfully parsed and are ready for validation:")
+        st.markdown(
+            f"### ✅ Successfully Parsed Names ({valid_preview['count']} total)\n\n"
+            "These names were successfully parsed and are ready for validation:"
+        )
         
         if valid_preview['sample_data']:
-            sample_df = pd.DataFrame(valid_preview['sample_data'])
-            display_columns = ['first_name', 'last_name', 'middle_name', 'title', 'suffix', 'source_file']
-            available_columns = [col for col in display_columns if col in sample_df.columns]
-            st.dataframe(sample_df[available_columns], use_container_width=True)
+            # Sample records share one key set; build only the displayed columns
+            available_columns = [col for col in VALID_NAME_SAMPLE_COLUMNS if col in valid_preview['sample_data'][0]]
+            st.dataframe(pd.DataFrame(valid_preview['sample_data'], columns=available_columns), use_container_width=True)
             
             if valid_preview['count'] > 10:
                 st.info(f"Showing first 10 of {valid_preview['count']} successfully parsed names")
@@ -784,30 +691,31 @@ def display_name_parsing_preview(preview_result: Dict, parsing_result: Dict):
         
         # Quality analysis
         if invalid_preview['quality_analysis']:
-            st.write("**Most Common Issues:**")
-            for issue, count in invalid_preview['top_issues']:
-                percentage = (count / invalid_preview['count']) * 100
-                st.write(f"• **{issue}**: {count} records ({percentage:.1f}%)")
+            top_issues = pd.Series(dict(invalid_preview['top_issues']), dtype=int)
+            percentages = (top_issues / invalid_preview['count'] * 100).map('{:.1f}'.format)
+            issue_lines = (
+                "• **" + top_issues.index + "**: " + top_issues.astype(str) + " records (" + percentages + "%)"
+            )
+            st.markdown("\n\n".join(["**Most Common Issues:**", *issue_lines]))
         
         # Sample invalid data
         if invalid_preview['sample_data']:
             with st.expander(f"View Sample Invalid Names (showing 10 of {invalid_preview['count']})"):
-                sample_df = pd.DataFrame(invalid_preview['sample_data'])
-                display_columns = ['first_name', 'last_name', 'name_quality_issues', 'source_file']
-                available_columns = [col for col in display_columns if col in sample_df.columns]
-                st.dataframe(sample_df[available_columns], use_container_width=True)
+                available_columns = [col for col in INVALID_NAME_SAMPLE_COLUMNS if col in invalid_preview['sample_data'][0]]
+                st.dataframe(pd.DataFrame(invalid_preview['sample_data'], columns=available_columns), use_container_width=True)
     
     # Download options
     st.markdown("### 📥 Download Parsed Data")
     
     col1, col2, col3 = st.columns(3)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    standardized_df = parsing_result['standardized_data']
+    name_valid_mask = parsing_result.get('name_valid_mask')
     
     with col1:
         if valid_preview['count'] > 0:
-            valid_df = parsing_result['standardized_data']
-            valid_names_df = valid_df[valid_df['name_valid'] == True] if 'name_valid' in valid_df.columns else valid_df
-            valid_csv = valid_names_df.to_csv(index=False)
+            valid_names_df = standardized_df[name_valid_mask] if name_valid_mask is not None else standardized_df
+            valid_csv = cached_csv_bytes(valid_names_df)
             st.download_button(
                 label=f"📥 Download Valid Names ({valid_preview['count']})",
                 data=valid_csv,
@@ -818,10 +726,9 @@ def display_name_parsing_preview(preview_result: Dict, parsing_result: Dict):
     
     with col2:
         if invalid_preview['count'] > 0:
-            invalid_df = parsing_result['standardized_data']
-            invalid_names_df = invalid_df[invalid_df['name_valid'] == False] if 'name_valid' in invalid_df.columns else pd.DataFrame()
+            invalid_names_df = standardized_df[~name_valid_mask] if name_valid_mask is not None else pd.DataFrame()
             if not invalid_names_df.empty:
-                invalid_csv = invalid_names_df.to_csv(index=False)
+                invalid_csv = cached_csv_bytes(invalid_names_df)
                 st.download_button(
                     label=f"📥 Download Invalid Names ({invalid_preview['count']})",
                     data=invalid_csv,
@@ -831,8 +738,7 @@ def display_name_parsing_preview(preview_result: Dict, parsing_result: Dict):
                 )
     
     with col3:
-        all_parsed_df = parsing_result['standardized_data']
-        all_csv = all_parsed_df.to_csv(index=False)
+        all_csv = cached_csv_bytes(standardized_df)
         st.download_button(
             label=f"📥 Download All Parsed ({overview['total_records']})",
             data=all_csv,
@@ -842,14 +748,15 @@ def display_name_parsing_preview(preview_result: Dict, parsing_result: Dict):
         )
 
 def process_complete_name_pipeline(file_data_list: List[Tuple[pd.DataFrame, str]], 
-                                 include_suggestions: bool, max_records: int):
+                                 include_suggestions: bool, max_records: int,
+                                 total_rows: Optional[int] = None):
     """Process complete name validation pipeline"""
     
     debug_monitor.log("INFO", f"Starting complete name pipeline for {len(file_data_list)} files", "NAME_PIPELINE")
     debug_monitor.update_stats('name_validations')
     
     try:
-        validation_service = EnhancedValidationService(debug_callback=lambda msg, cat="SERVICE": debug_monitor.log("INFO", msg, cat))
+        validation_service = get_validation_service()
         
         # Progress tracking
         progress_bar = st.progress(0)
@@ -863,21 +770,22 @@ def process_complete_name_pipeline(file_data_list: List[Tuple[pd.DataFrame, str]
         
         status_text.text("🔍 Step 3/3: Validating parsed names with enhanced algorithms...")
         
-        pipeline_result = validation_service.process_complete_name_validation_pipeline(
+        # Parse, preview and validate file by file without building the combined parsed frame
+        pipeline_result = validation_service.process_name_pipeline_fused(
             file_data_list=file_data_list,
             include_suggestions=include_suggestions,
-            max_records=max_records
+            max_records=max_records,
+            total_source_rows=total_rows
         )
         
-        progress_bar.progress(100)
-        status_text.text("✅ Complete name validation pipeline finished!")
-        time.sleep(1)
-        
-        # Clear progress
+        # Clear progress; completion is confirmed with a non-blocking toast
         progress_bar.empty()
         status_text.empty()
+        st.toast("✅ Complete name validation pipeline finished!")
         
         if pipeline_result['success']:
+            # Stamped once per run so download file names stay stable across reruns
+            pipeline_result['timestamp'] = datetime.now().strftime('%Y%m%d_%H%M%S')
             debug_monitor.update_stats('successful_validations')
             display_complete_name_pipeline_results(pipeline_result)
         else:
@@ -897,30 +805,18 @@ def display_complete_name_pipeline_results(pipeline_result: Dict):
     st.markdown("### 🎉 Complete Name Validation Results")
     
     summary = pipeline_result['summary']
-    preview_result = pipeline_result['preview']
+    standardization_result = pipeline_result['standardization']
     validation_result = pipeline_result['validation']
     
     # Overall summary metrics
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric("Files Processed", summary['files_processed'])
-    
-    with col2:
-        st.metric("Source Records", summary['total_source_rows'])
-    
-    with col3:
-        st.metric("Parsed Names", summary['parsed_names'])
-    
-    with col4:
-        st.metric("Valid Parsed", summary['valid_parsed_names'])
-    
-    with col5:
-        st.metric("Validated", summary['validated_names'])
-    
-    with col6:
-        success_rate = summary['validation_success_rate']
-        st.metric("Validation Rate", f"{success_rate:.1%}")
+    render_metric_grid([
+        ("Files Processed", summary['files_processed']),
+        ("Source Records", summary['total_source_rows']),
+        ("Parsed Names", summary['parsed_names']),
+        ("Valid Parsed", summary['valid_parsed_names']),
+        ("Validated", summary['validated_names']),
+        ("Validation Rate", f"{summary['validation_success_rate']:.1%}"),
+    ])
     
     # Parsing overview
     parsing_rate = summary['parsing_success_rate']
@@ -932,21 +828,16 @@ def display_complete_name_pipeline_results(pipeline_result: Dict):
         display_status_message(f"🔴 Low parsing rate: {parsing_rate:.1%} of names successfully parsed", "error")
     
     # Performance metrics
-    parsing_time = pipeline_result['standardization'].get('processing_time_ms', 0)
-    validation_time = pipeline_result['validation'].get('processing_time_ms', 0)
+    parsing_time = standardization_result.get('processing_time_ms', 0)
+    validation_time = validation_result.get('processing_time_ms', 0)
     total_time = pipeline_result.get('pipeline_duration_ms', 0)
     
     st.markdown("### ⚡ Performance Metrics")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Parsing Time", f"{parsing_time / 1000:.1f}s")
-    
-    with col2:
-        st.metric("Validation Time", f"{validation_time / 1000:.1f}s")
-    
-    with col3:
-        st.metric("Total Pipeline Time", f"{total_time / 1000:.1f}s")
+    render_metric_grid([
+        ("Parsing Time", f"{parsing_time / 1000:.1f}s"),
+        ("Validation Time", f"{validation_time / 1000:.1f}s"),
+        ("Total Pipeline Time", f"{total_time / 1000:.1f}s"),
+    ])
     
     # Validation results
     if validation_result['processed_records'] > 0:
@@ -955,10 +846,13 @@ def display_complete_name_pipeline_results(pipeline_result: Dict):
         st.markdown("### ⚠️ No Validation Results")
         display_status_message("No valid parsed names were available for validation.", "warning")
 
+# Rows shown from each end of a large results table
+RESULTS_TABLE_EDGE_ROWS = 100
+
 def display_name_validation_results(validation_result: Dict, pipeline_result: Dict):
     """Display name validation results"""
     
-    results_df = pd.DataFrame(validation_result['records'])
+    results_df = shrink_dataframe(records_to_dataframe(validation_result['records']))
     
     if results_df.empty:
         display_status_message("No validation results to display.", "warning")
@@ -968,119 +862,156 @@ def display_name_validation_results(validation_result: Dict, pipeline_result: Di
     
     # Name quality breakdown
     total_records = len(results_df)
-    valid_names = len(results_df[results_df['name_status'] == 'Valid']) if 'name_status' in results_df.columns else 0
+    # One pass over the status column instead of a boolean-mask copy per status
+    status_counts = results_df['name_status'].value_counts() if 'name_status' in results_df.columns else pd.Series(dtype=int)
+    valid_names = int(status_counts.get('Valid', 0))
     invalid_names = total_records - valid_names
+    summary = validation_result.get('summary', {})
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Validated", total_records)
-    
-    with col2:
-        valid_rate = valid_names / total_records if total_records > 0 else 0
-        st.metric("Valid Names", f"{valid_names} ({valid_rate:.1%})")
-    
-    with col3:
-        invalid_rate = invalid_names / total_records if total_records > 0 else 0
-        st.metric("Invalid Names", f"{invalid_names} ({invalid_rate:.1%})")
-    
-    with col4:
-        suggestions_count = validation_result['summary'].get('suggestions_provided', 0)
-        st.metric("Suggestions Provided", suggestions_count)
+    valid_rate = valid_names / total_records if total_records > 0 else 0
+    invalid_rate = invalid_names / total_records if total_records > 0 else 0
+    render_metric_grid([
+        ("Total Validated", total_records),
+        ("Valid Names", f"{valid_names} ({valid_rate:.1%})"),
+        ("Invalid Names", f"{invalid_names} ({invalid_rate:.1%})"),
+        ("Suggestions Provided", summary.get('suggestions_provided', 0)),
+    ])
     
     # Name statistics
-    summary = validation_result.get('summary', {})
     if summary:
         st.markdown("### 📊 Name Statistics")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Common First Names", summary.get('common_first_names', 0))
-        
-        with col2:
-            st.metric("Common Last Names", summary.get('common_last_names', 0))
-        
-        with col3:
-            st.metric("Uncommon Names", summary.get('uncommon_names', 0))
+        render_metric_grid([
+            ("Common First Names", summary.get('common_first_names', 0)),
+            ("Common Last Names", summary.get('common_last_names', 0)),
+            ("Uncommon Names", summary.get('uncommon_names', 0)),
+        ])
     
     # Enhanced info about suggestions
-    has_suggestions = any('suggestion' in col for col in results_df.columns)
+    has_suggestions = validation_result.get('has_suggestions', False)
     if has_suggestions:
         display_status_message("✅ Enhanced results with intelligent name suggestions and detailed analysis", "info")
     
     # Results table
     st.markdown("### 📊 Detailed Validation Results")
-    st.dataframe(results_df, use_container_width=True)
+    if len(results_df) > 2 * RESULTS_TABLE_EDGE_ROWS:
+        # Only the first and last rows go to the browser; downloads carry everything
+        st.dataframe(
+            pd.concat([results_df.head(RESULTS_TABLE_EDGE_ROWS), results_df.tail(RESULTS_TABLE_EDGE_ROWS)]),
+            use_container_width=True
+        )
+        st.caption(f"Showing the first and last {RESULTS_TABLE_EDGE_ROWS} of {len(results_df)} rows. Download below for the full results.")
+    else:
+        st.dataframe(results_df, use_container_width=True)
     
     # Download options
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = pipeline_result.get('timestamp') or datetime.now().strftime('%Y%m%d_%H%M%S')
     file_suffix = "_with_suggestions" if has_suggestions else "_basic"
     
-    col1, col2 = st.columns(2)
+    render_name_results_downloads(results_df, validation_result, pipeline_result, file_suffix, timestamp)
+
+@st.fragment
+def render_name_results_downloads(results_df: pd.DataFrame, validation_result: Dict, pipeline_result: Dict,
+                                  file_suffix: str, timestamp: str):
+    """Result download buttons; clicking one reruns only this fragment"""
+    col1, col2, col3 = st.columns(3)
     
     with col1:
-        csv_results = results_df.to_csv(index=False)
         st.download_button(
             label="📥 Download Name Validation Results (CSV)",
-            data=csv_results,
+            data=cached_csv_bytes(results_df),
             file_name=f"name_validation_results{file_suffix}_{timestamp}.csv",
             mime="text/csv",
             use_container_width=True
         )
     
     with col2:
-        # Create comprehensive Excel download
-        try:
-            import io
-            
-            excel_buffer = io.BytesIO()
-            with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
-                # Main validation results
-                results_df.to_excel(writer, sheet_name='Name Validation Results', index=False)
-                
-                # Summary sheet
-                preview_result = pipeline_result.get('preview', {})
-                if preview_result.get('success'):
-                    overview = preview_result['overview']
-                    
-                    summary_data = {
-                        'Metric': [
-                            'Files Processed', 'Total Input Records', 'Successfully Parsed', 'Failed to Parse',
-                            'Parsing Success Rate', 'Names Validated', 'Validation Success Rate',
-                            'Common First Names', 'Common Last Names', 'Uncommon Names',
-                            'Suggestions Provided', 'Pipeline Duration (ms)', 'Parsing Time (ms)', 'Validation Time (ms)'
-                        ],
-                        'Value': [
-                            pipeline_result['summary']['files_processed'],
-                            overview['total_records'],
-                            overview['valid_names'],
-                            overview['invalid_names'],
-                            f"{overview.get('parsing_success_rate', 0):.1%}",
-                            validation_result['successful_validations'],
-                            f"{pipeline_result['summary']['validation_success_rate']:.1%}",
-                            summary.get('common_first_names', 0),
-                            summary.get('common_last_names', 0),
-                            summary.get('uncommon_names', 0),
-                            summary.get('suggestions_provided', 0),
-                            pipeline_result.get('pipeline_duration_ms', 0),
-                            pipeline_result['standardization'].get('processing_time_ms', 0),
-                            pipeline_result['validation'].get('processing_time_ms', 0)
-                        ]
-                    }
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df.to_excel(writer, sheet_name='Pipeline Summary', index=False)
-            
-            excel_data = excel_buffer.getvalue()
-            
+        render_name_report_excel_download(results_df, validation_result, pipeline_result, file_suffix, timestamp)
+    
+    with col3:
+        # Columnar export; the pipeline summary travels as schema metadata
+        if PYARROW_AVAILABLE:
             st.download_button(
-                label="📊 Download Complete Name Report (Excel)",
-                data=excel_data,
-                file_name=f"complete_name_report{file_suffix}_{timestamp}.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                label="🗃️ Download Name Validation Results (Parquet)",
+                data=cached_parquet_bytes(results_df, {
+                    b'pipeline_summary': json.dumps(pipeline_result.get('summary', {}), default=str).encode('utf-8')
+                }),
+                file_name=f"name_validation_results{file_suffix}_{timestamp}.parquet",
+                mime="application/octet-stream",
                 use_container_width=True
             )
-        except ImportError:
-            st.info("Excel download requires xlsxwriter. Install with: pip install xlsxwriter")
+        else:
+            st.info("Parquet download requires pyarrow. Install with: pip install pyarrow")
+
+def build_name_report_excel(results_df: pd.DataFrame, validation_result: Dict, pipeline_result: Dict) -> bytes:
+    """Build the complete name report workbook (results + pipeline summary sheets)"""
+    summary = validation_result.get('summary', {})
+    
+    excel_buffer = io.BytesIO()
+    # constant_memory flushes each row to disk instead of holding the whole sheet;
+    # strings are written as plain text, skipping the per-cell URL/formula checks
+    with pd.ExcelWriter(excel_buffer, engine='xlsxwriter',
+                        engine_kwargs={'options': {
+                            'constant_memory': True,
+                            'strings_to_urls': False,
+                            'strings_to_formulas': False,
+                            'strings_to_numbers': False
+                        }}) as writer:
+        # Main validation results
+        write_excel_sheet(writer, results_df, 'Name Validation Results')
+        
+        # Summary sheet
+        preview_result = pipeline_result.get('preview', {})
+        if preview_result.get('success'):
+            overview = preview_result['overview']
+            pipeline_summary = pipeline_result['summary']
+            
+            summary_rows = [
+                ('Files Processed', pipeline_summary['files_processed']),
+                ('Total Input Records', overview['total_records']),
+                ('Successfully Parsed', overview['valid_names']),
+                ('Failed to Parse', overview['invalid_names']),
+                ('Parsing Success Rate', f"{overview.get('parsing_success_rate', 0):.1%}"),
+                ('Names Validated', validation_result['successful_validations']),
+                ('Validation Success Rate', f"{pipeline_summary['validation_success_rate']:.1%}"),
+                ('Common First Names', summary.get('common_first_names', 0)),
+                ('Common Last Names', summary.get('common_last_names', 0)),
+                ('Uncommon Names', summary.get('uncommon_names', 0)),
+                ('Suggestions Provided', summary.get('suggestions_provided', 0)),
+                ('Pipeline Duration (ms)', pipeline_result.get('pipeline_duration_ms', 0)),
+                ('Parsing Time (ms)', pipeline_result['standardization'].get('processing_time_ms', 0)),
+                ('Validation Time (ms)', validation_result.get('processing_time_ms', 0)),
+            ]
+            write_excel_sheet(writer, pd.DataFrame(summary_rows, columns=['Metric', 'Value']), 'Pipeline Summary')
+    
+    return excel_buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def cached_name_report_excel(results_df: pd.DataFrame, pipeline_summary: Dict,
+                             _validation_result: Dict, _pipeline_result: Dict) -> bytes:
+    """Excel report bytes, keyed on the results frame and pipeline summary so repeat clicks skip the rebuild"""
+    return build_name_report_excel(results_df, _validation_result, _pipeline_result)
+
+@st.fragment
+def render_name_report_excel_download(results_df: pd.DataFrame, validation_result: Dict, pipeline_result: Dict,
+                                      file_suffix: str, timestamp: str):
+    """Build the Excel report only on request; the button reruns just this fragment"""
+    if not st.button("📊 Build Complete Name Report (Excel)", use_container_width=True):
+        return
+    
+    try:
+        excel_data = cached_name_report_excel(results_df, pipeline_result.get('summary', {}),
+                                              validation_result, pipeline_result)
+    except ImportError:
+        st.info("Excel download requires xlsxwriter. Install with: pip install xlsxwriter")
+        return
+    
+    st.download_button(
+        label="📊 Download Complete Name Report (Excel)",
+        data=excel_data,
+        file_name=f"complete_name_report{file_suffix}_{timestamp}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        use_container_width=True
+    )
 
 # ADDRESS VALIDATION PROCESSING FUNCTIONS (Existing - preserved)
 
@@ -1089,7 +1020,7 @@ def generate_address_qualification_preview(file_data_list: List[Tuple[pd.DataFra
     debug_monitor.log("INFO", "Generating address qualification preview", "ADDRESS_QUALIFICATION")
     
     try:
-        validation_service = EnhancedValidationService(debug_callback=lambda msg, cat="SERVICE": debug_monitor.log("INFO", msg, cat))
+        validation_service = get_validation_service()
         
         with st.spinner("🔄 Analyzing address formats, standardizing data, and assessing US qualification..."):
             standardization_result = validation_service.standardize_and_qualify_csv_files(file_data_list)
@@ -1108,6 +1039,8 @@ def generate_address_qualification_preview(file_data_list: List[Tuple[pd.DataFra
         display_status_message(f"Error generating qualification preview: {str(e)}", "error")
         debug_monitor.log("ERROR", "Address qualification preview failed", "ADDRESS_QUALIFICATION", error=str(e))
 
+QUALIFIED_ADDRESS_SAMPLE_COLUMNS = ('first_name', 'last_name', 'street_address', 'city', 'state', 'zip_code', 'source_file')
+
 def display_comprehensive_address_qualification_preview(preview_result: Dict, standardization_result: Dict):
     """Display comprehensive address qualification preview (existing functionality)"""
     
@@ -1148,33 +1081,18 @@ def display_comprehensive_address_qualification_preview(preview_result: Dict, st
     if file_breakdown:
         st.markdown("### 📁 Results by File")
         
-        for filename, stats in file_breakdown.items():
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-            with col1:
-                st.write(f"**{filename}**")
-            with col2:
-                st.write(f"{stats['total']} total")
-            with col3:
-                st.write(f"{stats['qualified']} qualified")
-            with col4:
-                rate_text = f"{stats['rate']:.1%}"
-                if stats['rate'] > 0.8:
-                    st.write(f"🟢 {rate_text}")
-                elif stats['rate'] > 0.5:
-                    st.write(f"🟡 {rate_text}")
-                else:
-                    st.write(f"🔴 {rate_text}")
+        render_file_breakdown_table(file_breakdown, 'qualified', 'Qualified')
     
     # Qualified addresses preview (same as original)
     if qualified_preview['count'] > 0:
-        st.markdown(f"### ✅ Qualified US Addresses ({qualified_preview['count']} total)")
-        st.write("These addresses meet US format requirements and will be validated with USPS:")
+        st.markdown(
+            f"### ✅ Qualified US Addresses ({qualified_preview['count']} total)\n\n"
+            "These addresses meet US format requirements and will be validated with USPS:"
+        )
         
         if qualified_preview['sample_data']:
-            sample_df = pd.DataFrame(qualified_preview['sample_data'])
-            display_columns = ['first_name', 'last_name', 'street_address', 'city', 'state', 'zip_code', 'source_file']
-            available_columns = [col for col in display_columns if col in sample_df.columns]
-            st.dataframe(sample_df[available_columns], use_container_width=True)
+            available_columns = [col for col in QUALIFIED_ADDRESS_SAMPLE_COLUMNS if col in qualified_preview['sample_data'][0]]
+            st.dataframe(pd.DataFrame(qualified_preview['sample_data'], columns=available_columns), use_container_width=True)
             
             if qualified_preview['count'] > 10:
                 st.info(f"Showing first 10 of {qualified_preview['count']} qualified addresses")
@@ -1182,20 +1100,34 @@ def display_comprehensive_address_qualification_preview(preview_result: Dict, st
     # Download options (same as original)
     st.markdown("### 📥 Download Standardized Data")
     
+    render_qualified_address_downloads(standardization_result['qualified_data'], qualified_preview['count'],
+                                       datetime.now().strftime('%Y%m%d_%H%M%S'))
+
+@st.fragment
+def render_qualified_address_downloads(qualified_df: pd.DataFrame, qualified_count: int, timestamp: str):
+    """Qualified address download buttons; clicking one reruns only this fragment"""
     col1, col2, col3 = st.columns(3)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
     with col1:
-        if qualified_preview['count'] > 0:
-            qualified_df = standardization_result['qualified_data']
-            qualified_csv = qualified_df.to_csv(index=False)
+        if qualified_count > 0:
+            qualified_csv = cached_csv_bytes(qualified_df)
             st.download_button(
-                label=f"📥 Download Qualified Addresses ({qualified_preview['count']})",
+                label=f"📥 Download Qualified Addresses ({qualified_count})",
                 data=qualified_csv,
                 file_name=f"qualified_addresses_{timestamp}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
+    
+    with col2:
+        if qualified_count > 0 and PYARROW_AVAILABLE:
+            st.download_button(
+                label="🗃️ Download Qualified Addresses (Parquet)",
+                data=cached_parquet_bytes(qualified_df),
+                file_name=f"qualified_addresses_{timestamp}.parquet",
+                mime="application/octet-stream",
+                use_container_width=True
+            )
 
 def process_complete_address_pipeline(file_data_list: List[Tuple[pd.DataFrame, str]], 
                                     include_suggestions: bool, max_records: int):
@@ -1205,7 +1137,7 @@ def process_complete_address_pipeline(file_data_list: List[Tuple[pd.DataFrame, s
     debug_monitor.update_stats('address_validations')
     
     try:
-        validation_service = EnhancedValidationService(debug_callback=lambda msg, cat="SERVICE": debug_monitor.log("INFO", msg, cat))
+        validation_service = get_validation_service()
         
         if not validation_service.is_address_validation_available():
             display_status_message("USPS API credentials not configured. Please contact administrator.", "error")
@@ -1230,15 +1162,14 @@ def process_complete_address_pipeline(file_data_list: List[Tuple[pd.DataFrame, s
             max_records=max_records
         )
         
-        progress_bar.progress(100)
-        status_text.text("✅ Complete address pipeline finished!")
-        time.sleep(1)
-        
-        # Clear progress
+        # Clear progress; completion is confirmed with a non-blocking toast
         progress_bar.empty()
         status_text.empty()
+        st.toast("✅ Complete address pipeline finished!")
         
         if pipeline_result['success']:
+            # Stamped once per run so download file names stay stable across reruns
+            pipeline_result['timestamp'] = datetime.now().strftime('%Y%m%d_%H%M%S')
             debug_monitor.update_stats('successful_validations')
             # Use existing display function for address results
             display_complete_address_pipeline_results(pipeline_result)
@@ -1259,30 +1190,18 @@ def display_complete_address_pipeline_results(pipeline_result: Dict):
     st.markdown("### 🎉 Complete Address Processing Results")
     
     summary = pipeline_result['summary']
-    preview_result = pipeline_result['preview']
-    validation_result = pipeline_result['validation']
+    validated_rows = summary['validated_rows']
     
     # Overall summary metrics
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric("Files Processed", summary['files_processed'])
-    
-    with col2:
-        st.metric("Source Rows", summary['total_source_rows'])
-    
-    with col3:
-        st.metric("Qualified", summary['qualified_rows'])
-    
-    with col4:
-        st.metric("Validated", summary['validated_rows'])
-    
-    with col5:
-        st.metric("Valid Results", summary['successful_validations'])
-    
-    with col6:
-        success_rate = summary['successful_validations'] / summary['validated_rows'] if summary['validated_rows'] > 0 else 0
-        st.metric("USPS Success Rate", f"{success_rate:.1%}")
+    success_rate = summary['successful_validations'] / validated_rows if validated_rows > 0 else 0
+    render_metric_grid([
+        ("Files Processed", summary['files_processed']),
+        ("Source Rows", summary['total_source_rows']),
+        ("Qualified", summary['qualified_rows']),
+        ("Validated", validated_rows),
+        ("Valid Results", summary['successful_validations']),
+        ("USPS Success Rate", f"{success_rate:.1%}"),
+    ])
     
     # Rest of the display functionality same as original...
 
@@ -1297,106 +1216,92 @@ def render_single_validation():
     </div>
     ''', unsafe_allow_html=True)
     
-    # Personal Information Section
-    st.markdown("**Personal Information**")
-    col1, col2 = st.columns(2)
+    # Inputs live in a form so edits don't rerun the script until submit
+    with st.form("single_validation", clear_on_submit=False):
+        # Personal Information Section
+        st.markdown("**Personal Information**")
+        col1, col2 = st.columns(2)
     
-    with col1:
-        first_name = st.text_input(
-            "First Name", 
-            key="fn",
-            placeholder="Enter first name",
-            help="Enter the person's first name"
-        )
-    with col2:
-        last_name = st.text_input(
-            "Last Name", 
-            key="ln",
-            placeholder="Enter last name", 
-            help="Enter the person's last name"
-        )
-    
-    # Address Information Section
-    st.markdown("**Address Information**")
-    street_address = st.text_input(
-        "Street Address", 
-        key="sa",
-        placeholder="123 Main Street, Apt 4B",
-        help="Enter the complete street address including apartment/unit number if applicable"
-    )
+        with col1:
+            first_name = st.text_input(
+                "First Name", 
+                key="fn",
+                placeholder="Enter first name",
+                help="Enter the person's first name"
+            )
+        with col2:
+            last_name = st.text_input(
+                "Last Name", 
+                key="ln",
+                placeholder="Enter last name", 
+                help="Enter the person's last name"
+            )
     
-    col3, col4, col5 = st.columns([3, 1, 2])
-    with col3:
-        city = st.text_input(
-            "City", 
-            key="city",
-            placeholder="Enter city",
-            help="Enter the city name"
-        )
-    with col4:
-        state = st.text_input(
-            "State", 
-            key="state",
-            placeholder="CA",
-            help="Enter 2-letter state code (e.g., CA, NY, TX)",
-            max_chars=2
-        )
-    with col5:
-        zip_code = st.text_input(
-            "ZIP Code", 
-            key="zip",
-            placeholder="12345 or 12345-6789",
-            help="Enter 5-digit ZIP code or ZIP+4 format"
+        # Address Information Section
+        st.markdown("**Address Information**")
+        street_address = st.text_input(
+            "Street Address", 
+            key="sa",
+            placeholder="123 Main Street, Apt 4B",
+            help="Enter the complete street address including apartment/unit number if applicable"
         )
     
-    # Validation Logic
-    all_fields_have_content = all([
-        first_name and first_name.strip(),
-        last_name and last_name.strip(),
-        street_address and street_address.strip(),
-        city and city.strip(),
-        state and state.strip(),
-        zip_code and zip_code.strip()
-    ])
-    
-    # Validation Button
-    button_col1, button_col2, button_col3 = st.columns([1, 2, 1])
-    
-    with button_col2:
-        if st.button(
+        col3, col4, col5 = st.columns([3, 1, 2])
+        with col3:
+            city = st.text_input(
+                "City", 
+                key="city",
+                placeholder="Enter city",
+                help="Enter the city name"
+            )
+        with col4:
+            state = st.text_input(
+                "State", 
+                key="state",
+                placeholder="CA",
+                help="Enter 2-letter state code (e.g., CA, NY, TX)",
+                max_chars=2
+            )
+        with col5:
+            zip_code = st.text_input(
+                "ZIP Code", 
+                key="zip",
+                placeholder="12345 or 12345-6789",
+                help="Enter 5-digit ZIP code or ZIP+4 format"
+            )
+        
+        submitted = st.form_submit_button(
             "🔍 Validate Record", 
-            disabled=not all_fields_have_content, 
             type="primary",
             use_container_width=True
-        ):
-            process_single_validation(first_name, last_name, street_address, city, state, zip_code)
+        )
+    
+    # Validation Logic: strip each field once and collect the blank ones
+    required_fields = (
+        ("First Name", first_name),
+        ("Last Name", last_name),
+        ("Street Address", street_address),
+        ("City", city),
+        ("State", state),
+        ("ZIP Code", zip_code)
+    )
+    missing_fields = [label for label, value in required_fields if not (value and value.strip())]
+    all_fields_have_content = not missing_fields
+    
+    if submitted and all_fields_have_content:
+        process_single_validation(first_name, last_name, street_address, city, state, zip_code)
     
     if not all_fields_have_content:
-        missing_fields = []
-        if not first_name or not first_name.strip():
-            missing_fields.append("First Name")
-        if not last_name or not last_name.strip():
-            missing_fields.append("Last Name")
-        if not street_address or not street_address.strip():
-            missing_fields.append("Street Address")
-        if not city or not city.strip():
-            missing_fields.append("City")
-        if not state or not state.strip():
-            missing_fields.append("State")
-        if not zip_code or not zip_code.strip():
-            missing_fields.append("ZIP Code")
-        
-        if missing_fields:
-            display_status_message(f"Please complete the following required fields: {', '.join(missing_fields)}", "info")
+        display_status_message(f"Please complete the following required fields: {', '.join(missing_fields)}", "info")
 
 def process_single_validation(first_name: str, last_name: str, street_address: str, city: str, state: str, zip_code: str):
     """Process single record validation (existing functionality preserved)"""
     
     debug_monitor.log("INFO", "Starting single validation process", "VALIDATION")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        validation_service = EnhancedValidationService(debug_callback=lambda msg, cat="SERVICE": debug_monitor.log("INFO", msg, cat))
+        validation_service = get_validation_service()
         
         if not validation_service.is_address_validation_available():
             display_status_message("USPS API credentials not configured. Please contact administrator.", "error")
@@ -1409,26 +1314,17 @@ def process_single_validation(first_name: str, last_name: str, street_address: s
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            status_text.text("Validating name...")
+            status_text.text("Validating name and address with USPS...")
             progress_bar.progress(25)
-            time.sleep(0.3)
-            
-            status_text.text("Validating address with USPS...")
-            progress_bar.progress(75)
-            time.sleep(0.3)
             
             result = validation_service.validate_single_record(
                 first_name, last_name, street_address, city, state, zip_code
             )
             
-            progress_bar.progress(100)
-            status_text.text("Validation complete")
-            time.sleep(0.5)
-            
             progress_bar.empty()
             status_text.empty()
             
-            total_duration = int((time.time() - start_time) * 1000)
+            total_duration = int((time.perf_counter() - start_time) * 1000)
             debug_monitor.update_stats('successful_validations' if result['overall_valid'] else 'failed_validations')
             
             display_single_validation_results(result)
@@ -1475,33 +1371,60 @@ def render_complete_monitoring_dashboard():
     ''', unsafe_allow_html=True)
     
     # System Statistics
-    stats = st.session_state.validation_stats
+    stats = dict(st.session_state.validation_stats)  # plain-dict snapshot for the metrics below
     uptime = datetime.now() - stats['session_start']
     
     st.markdown("### 📊 System Statistics")
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric("Total Validations", stats['total_validations'])
-    
-    with col2:
-        st.metric("Successful", stats['successful_validations'])
-    
-    with col3:
-        st.metric("Failed", stats['failed_validations'])
-    
-    with col4:
-        st.metric("Name Validations", stats['name_validations'])
-    
-    with col5:
-        st.metric("Address Validations", stats['address_validations'])
-    
-    with col6:
-        uptime_str = f"{uptime.total_seconds() / 3600:.1f}h"
-        st.metric("Session Uptime", uptime_str)
+    render_metric_grid([
+        ("Total Validations", stats['total_validations']),
+        ("Successful", stats['successful_validations']),
+        ("Failed", stats['failed_validations']),
+        ("Name Validations", stats['name_validations']),
+        ("Address Validations", stats['address_validations']),
+        ("Session Uptime", f"{uptime.total_seconds() / 3600:.1f}h"),
+    ])
 
 # MAIN APPLICATION
 
+@st.cache_data(ttl=300, show_spinner=False)
+def load_usps_credentials_cached() -> Tuple[Optional[str], Optional[str]]:
+    """Read USPS credentials from secrets/environment at most once every 5 minutes"""
+    return load_usps_credentials()
+
+API_STATUS_CONNECTED_HTML = '''
+    <div style="text-align: center; margin-bottom: 1rem;">
+        <span style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); 
+                     color: white; padding: 0.5rem 1.2rem; border-radius: 25px; 
+                     font-weight: 600; font-size: 0.8rem; 
+                     box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);">
+            ✓ USPS API Connected - Address Validation Available
+        </span>
+    </div>
+'''
+
+API_STATUS_DISCONNECTED_HTML = '''
+    <div style="text-align: center; margin-bottom: 1rem;">
+        <span style="background: linear-gradient(135deg, #991b1b 0%, #dc2626 100%); 
+                     color: white; padding: 0.5rem 1.2rem; border-radius: 25px; 
+                     font-weight: 600; font-size: 0.8rem; 
+                     box-shadow: 0 4px 12px rgba(239, 68, 68, 0.3);">
+            ✗ USPS API Not Connected - Name Validation Only
+        </span>
+    </div>
+'''
+
+APP_HEADER_HTML = '''
+    <div class="enterprise-header">
+        <div class="main-title">Enhanced Name & Address Validator</div>
+        <div class="subtitle">AI-Powered Name Parsing • Multi-File Processing • Address Validation • Powered by ML and USPS</div>
+    </div>
+'''
+
+def render_app_header(connected: bool):
+    """Show the page header and USPS API connection badge as one element"""
+    st.markdown(APP_HEADER_HTML + (API_STATUS_CONNECTED_HTML if connected else API_STATUS_DISCONNECTED_HTML),
+                unsafe_allow_html=True)
+
 def main():
     """Enhanced main application with name and address validation options"""
     st.set_page_config(
@@ -1518,42 +1441,13 @@ def main():
     
     # Check credentials first
     try:
-        client_id, client_secret = load_usps_credentials()
+        client_id, client_secret = load_usps_credentials_cached()
     except Exception as e:
         st.error(f"Error loading credentials: {e}")
         client_id, client_secret = None, None
     
-    # Header
-    st.markdown('''
-    <div class="enterprise-header">
-        <div class="main-title">Enhanced Name & Address Validator</div>
-        <div class="subtitle">AI-Powered Name Parsing • Multi-File Processing • Address Validation • Powered by ML and USPS</div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # API Connection Status (for address validation)
-    if client_id and client_secret:
-        st.markdown('''
-        <div style="text-align: center; margin-bottom: 1rem;">
-            <span style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); 
-                         color: white; padding: 0.5rem 1.2rem; border-radius: 25px; 
-                         font-weight: 600; font-size: 0.8rem; 
-                         box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);">
-                ✓ USPS API Connected - Address Validation Available
-            </span>
-        </div>
-        ''', unsafe_allow_html=True)
-    else:
-        st.markdown('''
-        <div style="text-align: center; margin-bottom: 1rem;">
-            <span style="background: linear-gradient(135deg, #991b1b 0%, #dc2626 100%); 
-                         color: white; padding: 0.5rem 1.2rem; border-radius: 25px; 
-                         font-weight: 600; font-size: 0.8rem; 
-                         box-shadow: 0 4px 12px rgba(239, 68, 68, 0.3);">
-                ✗ USPS API Not Connected - Name Validation Only
-            </span>
-        </div>
-        ''', unsafe_allow_html=True)
+    # Header and API connection status (for address validation)
+    render_app_header(bool(client_id and client_secret))
     
     # Main application tabs
     tab1, tab2, tab3 = st.tabs(["Single Validation", "Enhanced Multi-File Processing", "Monitoring"])
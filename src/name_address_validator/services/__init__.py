@@ -1,25 +1,15 @@
 """Validation services module"""
 
+import importlib
+import os
+
+# Implementation module is chosen at install/deploy time instead of probing
+# candidates with failing imports; set NAV_SERVICE_IMPL=fallback_service for the no-op service
+SERVICE_IMPL = os.environ.get('NAV_SERVICE_IMPL', 'validation_service')
+
 try:
-    from .validation_service import ValidationService
-except ImportError:
-    try:
-        from .validation_service_working import ValidationService
-    except ImportError:
-        class ValidationService:
-            def __init__(self, debug_callback=None):
-                print("⚠️ Using minimal ValidationService fallback")
-            
-            def validate_single_record(self, first_name, last_name, street_address, city, state, zip_code):
-                return {
-                    'timestamp': 'test',
-                    'name_result': {'valid': True, 'confidence': 0.5},
-                    'address_result': {'deliverable': False, 'error': 'Service not available'},
-                    'overall_valid': False,
-                    'overall_confidence': 0.25,
-                    'processing_time_ms': 0,
-                    'errors': ['ValidationService not properly loaded'],
-                    'warnings': ['Using fallback service']
-                }
+    ValidationService = importlib.import_module(f'.{SERVICE_IMPL}', __package__).ValidationService
+except (ImportError, AttributeError) as e:
+    raise ImportError(f"Cannot load ValidationService from services.{SERVICE_IMPL}: {e}") from e
 
 __all__ = ['ValidationService']
@@ -4,8 +4,15 @@ Enhanced ValidationService with name-only validation workflows
 Extends the existing validation service to support intelligent name parsing and validation
 """
 
+import os
 import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
@@ -16,6 +23,53 @@ from ..utils.logger import debug_logger, performance_tracker
 from ..utils.address_standardizer import AddressFormatStandardizer
 from ..utils.name_format_standardizer import NameFormatStandardizer
 
+# Upper bound on memoized name validations kept by a service instance (oldest evicted first)
+NAME_CACHE_MAX_ENTRIES = 100_000
+
+# Parsed-name text columns carried into batch validation results
+NAME_TEXT_COLUMNS = ('first_name', 'last_name', 'middle_name', 'title', 'suffix')
+
+# Below this many distinct uncached names, worker start-up costs more than validating in turn
+PARALLEL_MIN_NAMES = 5_000
+
+# USPS lookups are latency-bound: default requests in flight (see address_concurrency), submitted this many addresses at a time
+ADDRESS_BATCH_CONCURRENCY = 20
+ADDRESS_BATCH_CHUNK_SIZE = 100
+# Fields of one USPS address request, in validate_address's expected keys
+ADDRESS_FIELDS = ('street_address', 'city', 'state', 'zip_code')
+
+# How long a get_service_status snapshot is reused by callers that poll it
+SERVICE_STATUS_TTL_SECONDS = 1.0
+
+_worker_name_validator = None
+
+
+def _validate_names_in_worker(pairs: List[Tuple[str, str]]) -> List[Dict]:
+    """Process-pool entry point: validate (first, last) pairs with a validator built once per worker"""
+    global _worker_name_validator
+    if _worker_name_validator is None:
+        _worker_name_validator = EnhancedNameValidator()
+    return [_worker_name_validator.validate(first_name, last_name) for first_name, last_name in pairs]
+
+
+class QualificationResult(dict):
+    """standardize_and_qualify_csv_files result: qualified_data and disqualified_data are still
+    available but sliced from standardized_data by their mask on each access instead of stored as copies"""
+    
+    MASKED_KEYS = {'qualified_data': 'qualified_mask', 'disqualified_data': 'disqualified_mask'}
+    
+    def __missing__(self, key):
+        mask_key = self.MASKED_KEYS.get(key)
+        if mask_key is None or not dict.__contains__(self, mask_key):
+            raise KeyError(key)
+        return self['standardized_data'][self[mask_key]]
+    
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or dict.__contains__(self, self.MASKED_KEYS.get(key))
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
 
 class EnhancedValidationService:
     """
@@ -23,12 +77,27 @@ class EnhancedValidationService:
     Supports both existing address validation and new name-only workflows
     """
     
-    def __init__(self, debug_callback=None):
+    def __init__(self, debug_callback=None, name_batch_size: Optional[int] = None,
+                 address_concurrency: int = ADDRESS_BATCH_CONCURRENCY):
         self.debug_callback = debug_callback or debug_logger.info
+        # Names per worker task in parallel validation; None sizes tasks from each batch (override for profiling)
+        self._name_batch_size = name_batch_size
+        # Concurrent USPS requests per batch (tune to the USPS rate limit); also sizes the connection pool
+        self._address_concurrency = max(1, address_concurrency)
         
         # Initialize existing components
         self.name_validator = EnhancedNameValidator()
         self.address_validator = None
+        
+        # Name validation results keyed on lower-cased (first, last); the service is shared across sessions
+        self._name_cache: Dict[Tuple[str, str], Dict] = {}
+        self._name_cache_lock = threading.Lock()
+        # Built once; returned for records with neither a first nor a last name
+        self._empty_name_result = self.name_validator.validate('', '')
+        # (monotonic time, status) of the last get_service_status call
+        self._status_cache: Optional[Tuple[float, Dict]] = None
+        # Per-thread log buffer for pool workers; the debug callback may only work on the calling thread
+        self._worker_logs = threading.local()
         self.address_standardizer = AddressFormatStandardizer(debug_callback=self.debug_callback)
         
         # Initialize new name standardizer
@@ -45,10 +114,14 @@ class EnhancedValidationService:
         try:
             client_id, client_secret = load_usps_credentials()
             if client_id and client_secret:
+                # Pooled keep-alive connections, enough for every concurrent batch request
+                usps_session = requests.Session()
+                usps_session.mount('https://', HTTPAdapter(pool_maxsize=self._address_concurrency))
                 self.address_validator = USPSAddressValidator(
                     client_id, 
                     client_secret,
-                    debug_callback=self.debug_callback
+                    debug_callback=self._address_log,
+                    session=usps_session
                 )
                 self.debug_callback("✅ USPS validator initialized", "SERVICE")
             else:
@@ -56,6 +129,67 @@ class EnhancedValidationService:
         except Exception as e:
             self.debug_callback(f"❌ Failed to initialize USPS validator: {str(e)}", "SERVICE")
     
+    @staticmethod
+    def _name_cache_key(first_name: str, last_name: str) -> Tuple[str, str]:
+        """The validator strips its inputs and its output doesn't depend on letter case"""
+        return ((first_name or '').strip().lower(), (last_name or '').strip().lower())
+    
+    def _store_name_results(self, keyed_results: List[Tuple[Tuple[str, str], Dict]]):
+        """Add validation results to the name cache, evicting the oldest entries past the limit"""
+        with self._name_cache_lock:
+            for key, validation_result in keyed_results:
+                if len(self._name_cache) >= NAME_CACHE_MAX_ENTRIES:
+                    del self._name_cache[next(iter(self._name_cache))]
+                self._name_cache[key] = validation_result
+    
+    def _validate_name_cached(self, first_name: str, last_name: str) -> Dict:
+        """
+        Validate a name, reusing earlier results for the same name in any case or padding.
+        The returned dict is shared between callers and must not be modified.
+        """
+        key = self._name_cache_key(first_name, last_name)
+        cached = self._name_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        validation_result = self.name_validator.validate(first_name, last_name)
+        self._store_name_results([(key, validation_result)])
+        return validation_result
+    
+    def _prevalidate_names_in_parallel(self, first_names: np.ndarray, last_names: np.ndarray):
+        """Validate a large batch's distinct uncached names across worker processes into the name cache"""
+        workers = os.cpu_count() or 1
+        if workers <= 1 or len(first_names) < PARALLEL_MIN_NAMES:
+            return
+        
+        pending = {}
+        for first_name, last_name in zip(first_names, last_names):
+            key = self._name_cache_key(first_name, last_name)
+            if key not in pending and key not in self._name_cache:
+                pending[key] = (first_name, last_name)
+        if len(pending) < PARALLEL_MIN_NAMES:
+            return
+        
+        keys = list(pending)
+        pairs = list(pending.values())
+        # Equal shares per worker so no straggler chunk holds up the batch, but never tiny tasks
+        chunk_size = self._name_batch_size or max(PARALLEL_MIN_NAMES // 4, -(-len(pairs) // workers))
+        chunks = [pairs[start:start + chunk_size] for start in range(0, len(pairs), chunk_size)]
+        workers = min(workers, len(chunks))
+        self.debug_callback(f"⚡ Validating {len(pairs)} distinct names on {workers} worker processes "
+                            f"({len(chunks)} chunks of up to {chunk_size})", "NAME_SERVICE")
+        try:
+            # spawn: forking a threaded server process is unsafe
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                chunk_results = executor.map(_validate_names_in_worker, chunks)
+                validation_results = [result for chunk in chunk_results for result in chunk]
+        except (OSError, RuntimeError) as e:
+            # Names left uncached are validated in turn by the batch loop
+            self.debug_callback(f"⚠️ Worker pool unavailable, validating names in turn: {e}", "NAME_SERVICE")
+            return
+        
+        self._store_name_results(list(zip(keys, validation_results)))
+    
     def is_address_validation_available(self) -> bool:
         """Check if USPS validation is available"""
         return self.address_validator is not None and self.address_validator.is_configured()
@@ -68,10 +202,10 @@ class EnhancedValidationService:
                              city: str, state: str, zip_code: str) -> Dict:
         """Validate a single record - existing functionality preserved"""
         self.debug_callback("🔍 Single record validation", "SERVICE")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         results = {
-            'timestamp': datetime.now(),
+            'timestamp': time.time(),  # epoch seconds; formatted only when displayed
             'name_result': None,
             'address_result': None,
             'overall_valid': False,
@@ -82,8 +216,11 @@ class EnhancedValidationService:
         }
         
         try:
-            # Validate name
-            name_result = self.name_validator.validate(first_name, last_name)
+            # Validate name (blank names skip the validator)
+            if not (first_name and first_name.strip()) and not (last_name and last_name.strip()):
+                name_result = self._empty_name_result
+            else:
+                name_result = self._validate_name_cached(first_name, last_name)
             results['name_result'] = name_result
             
             # Validate address if available
@@ -118,9 +255,130 @@ class EnhancedValidationService:
             results['errors'].append(error_msg)
             self.debug_callback(f"❌ {error_msg}", "SERVICE")
         
-        results['processing_time_ms'] = int((time.time() - start_time) * 1000)
+        results['processing_time_ms'] = int((time.perf_counter() - start_time) * 1000)
+        return results
+    
+    def validate_addresses_batch(self, address_list: List[Dict]) -> List[Dict]:
+        """Validate many addresses with concurrent USPS requests; results come back in input order"""
+        if not self.is_address_validation_available():
+            return [{'success': False, 'error': 'USPS API not configured', 'deliverable': False} for _ in address_list]
+        
+        self.debug_callback(f"🏠 Batch address validation: {len(address_list)} addresses", "SERVICE")
+        start_time = time.perf_counter()
+        
+        # Fetch the token up front so the worker threads share it instead of racing to request one
+        self.address_validator.get_access_token()
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=self._address_concurrency) as executor:
+            for start in range(0, len(address_list), ADDRESS_BATCH_CHUNK_SIZE):
+                chunk = address_list[start:start + ADDRESS_BATCH_CHUNK_SIZE]
+                for result, logs in executor.map(self._validate_address_safely, chunk):
+                    # Worker logs are replayed here, on the calling thread, in input order
+                    for message in logs:
+                        self.debug_callback(message, "SERVICE")
+                    results.append(result)
+        
+        self.debug_callback(f"✅ Batch address validation complete in {int((time.perf_counter() - start_time) * 1000)}ms", "SERVICE")
         return results
     
+    def _validate_address_safely(self, address_data: Dict) -> Tuple[Dict, List[str]]:
+        """validate_address for pool workers: one failing address must not abort the batch.
+        
+        Returns the result and the validator's log messages, buffered for the calling thread to replay.
+        """
+        logs = self._worker_logs.buffer = []
+        try:
+            return self.address_validator.validate_address(address_data), logs
+        except Exception as e:
+            return {'success': False, 'error': f"Address validation error: {str(e)}", 'deliverable': False}, logs
+        finally:
+            self._worker_logs.buffer = None
+    
+    def _address_log(self, message: str):
+        """Debug callback for the USPS validator: buffered on pool workers, passed straight through otherwise"""
+        buffer = getattr(self._worker_logs, 'buffer', None)
+        if buffer is not None:
+            buffer.append(message)
+        else:
+            self.debug_callback(message, "SERVICE")
+    
+    def validate_qualified_addresses(self, standardization_result: Dict, max_records: Optional[int] = None) -> Dict:
+        """Validate the qualified rows of an address standardization result (names and USPS addresses).
+        
+        Input columns are cleaned and the display address built with vectorized string ops; names are
+        validated once per distinct pair and only the USPS requests run per row.
+        """
+        start_time = time.perf_counter()
+        standardized_df = standardization_result['standardized_data']
+        qualified_mask = standardization_result.get('qualified_mask')
+        qualified_df = standardized_df[qualified_mask] if qualified_mask is not None else standardized_df
+        if max_records:
+            qualified_df = qualified_df.head(max_records)
+        total = len(qualified_df)
+        self.debug_callback(f"🏠 Validating {total} qualified address records", "SERVICE")
+        
+        # Clean every input column in one pass per column (missing values and columns read as '')
+        cols = {}
+        for col in ('first_name', 'last_name', *ADDRESS_FIELDS):
+            if col in qualified_df.columns:
+                cols[col] = qualified_df[col].fillna('').astype(str).str.strip()
+            else:
+                cols[col] = pd.Series('', index=qualified_df.index)
+        cols['state'] = cols['state'].str.upper()
+        original_address = (cols['street_address'] + ', ' + cols['city'] + ', ' + cols['state'] + ' ' + cols['zip_code']).tolist()
+        source_files = (qualified_df['source_file'].to_numpy(dtype=object) if 'source_file' in qualified_df.columns
+                        else np.full(total, 'unknown', dtype=object))
+        
+        # Names: one validation per distinct pair
+        first_names = cols['first_name'].to_numpy(dtype=object)
+        last_names = cols['last_name'].to_numpy(dtype=object)
+        pair_codes, pairs = self._name_pair_codes(first_names, last_names)
+        pair_results = [self._empty_name_result if not first_name and not last_name
+                        else self._validate_name_cached(first_name, last_name)
+                        for first_name, last_name in pairs]
+        
+        # Addresses: the only per-row work left is the USPS request; request dicts are zipped
+        # straight from the column arrays rather than round-tripped through DataFrame.to_dict
+        address_arrays = [cols[col].to_numpy(dtype=object) for col in ADDRESS_FIELDS]
+        address_results = self.validate_addresses_batch([dict(zip(ADDRESS_FIELDS, values)) for values in zip(*address_arrays)])
+        
+        records = []
+        rows = zip(pair_codes.tolist(), first_names, last_names, source_files, original_address, address_results)
+        for i, (code, first_name, last_name, source_file, address, address_result) in enumerate(rows, 1):
+            name_result = pair_results[code]
+            deliverable = bool(address_result.get('deliverable', False))
+            standardized = address_result.get('standardized') or {}
+            records.append({
+                'row': i,
+                'source_file': source_file,
+                'first_name': first_name,
+                'last_name': last_name,
+                'original_address': address,
+                'name_status': 'Valid' if name_result['valid'] else 'Invalid',
+                'deliverable': deliverable,
+                'standardized_address': (f"{standardized.get('street_address', '')}, {standardized.get('city', '')}, "
+                                         f"{standardized.get('state', '')} {standardized.get('zip_code', '')}" if standardized else ''),
+                'overall_valid': name_result['valid'] and deliverable,
+                'overall_confidence': (name_result.get('confidence', 0) + address_result.get('confidence', 0)) / 2,
+                'error': address_result.get('error', '')
+            })
+        
+        valid_count = sum(record['overall_valid'] for record in records)
+        duration = int((time.perf_counter() - start_time) * 1000)
+        performance_tracker.track("qualified_address_validation", duration, True)
+        self.debug_callback(f"✅ Qualified address validation complete: {valid_count}/{total} valid ({duration}ms)", "SERVICE")
+        
+        return {
+            'timestamp': time.time(),  # epoch seconds; formatted only when displayed
+            'total_records': total,
+            'processed_records': total,
+            'successful_validations': valid_count,
+            'failed_validations': total - valid_count,
+            'processing_time_ms': duration,
+            'records': records
+        }
+    
     # NEW NAME-ONLY VALIDATION METHODS
     
     def standardize_and_parse_names_from_csv(self, file_data_list: List[Tuple[pd.DataFrame, str]]) -> Dict:
@@ -129,7 +387,7 @@ class EnhancedValidationService:
         This is for name-only workflows
         """
         self.debug_callback(f"📦 STARTING name standardization for {len(file_data_list)} files", "NAME_STANDARDIZATION")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Use name standardizer to process files
@@ -140,7 +398,7 @@ class EnhancedValidationService:
                 return {
                     'success': False,
                     'error': 'No data could be standardized',
-                    'processing_time_ms': int((time.time() - start_time) * 1000),
+                    'processing_time_ms': int((time.perf_counter() - start_time) * 1000),
                     'total_rows': 0,
                     'valid_names': 0,
                     'invalid_names': 0
@@ -149,12 +407,14 @@ class EnhancedValidationService:
             # Generate summary
             summary = self.name_standardizer.get_name_standardization_summary(standardization_info)
             
-            duration = int((time.time() - start_time) * 1000)
+            duration = int((time.perf_counter() - start_time) * 1000)
             performance_tracker.track("name_standardization_parsing", duration, summary['successful_files'] > 0)
             
             result = {
                 'success': True,
                 'standardized_data': standardized_df,
+                # Computed once here so preview and download code index with it directly
+                'name_valid_mask': standardized_df['name_valid'].to_numpy(dtype=bool, na_value=False) if 'name_valid' in standardized_df.columns else None,
                 'standardization_info': standardization_info,
                 'summary': summary,
                 'processing_time_ms': duration,
@@ -172,7 +432,7 @@ class EnhancedValidationService:
             error_msg = f"Name standardization failed: {str(e)}"
             self.debug_callback(f"❌ {error_msg}", "NAME_STANDARDIZATION")
             
-            duration = int((time.time() - start_time) * 1000)
+            duration = int((time.perf_counter() - start_time) * 1000)
             performance_tracker.track("name_standardization_parsing", duration, False)
             
             return {
@@ -198,27 +458,48 @@ class EnhancedValidationService:
         standardized_df = standardization_result['standardized_data']
         summary = standardization_result['summary']
         
-        # Generate sample data
-        valid_df = standardized_df[standardized_df['name_valid'] == True] if 'name_valid' in standardized_df.columns else standardized_df
-        invalid_df = standardized_df[standardized_df['name_valid'] == False] if 'name_valid' in standardized_df.columns else pd.DataFrame()
-        
-        valid_sample = valid_df.head(10) if not valid_df.empty else pd.DataFrame()
-        invalid_sample = invalid_df.head(10) if not invalid_df.empty else pd.DataFrame()
+        # Generate sample data (split on the boolean mask; missing flags count as invalid)
+        name_valid_mask = standardization_result.get('name_valid_mask')
+        if name_valid_mask is None and 'name_valid' in standardized_df.columns:
+            name_valid_mask = standardized_df['name_valid'].to_numpy(dtype=bool, na_value=False)
+        # Only counts and the first 10 rows of each side are needed, so the filtered frames are never built
+        if name_valid_mask is not None:
+            valid_count = int(name_valid_mask.sum())
+            invalid_count = len(name_valid_mask) - valid_count
+            valid_sample = standardized_df.iloc[np.flatnonzero(name_valid_mask)[:10]]
+            invalid_sample = standardized_df.iloc[np.flatnonzero(~name_valid_mask)[:10]]
+        else:
+            valid_count, invalid_count = len(standardized_df), 0
+            valid_sample, invalid_sample = standardized_df.head(10), pd.DataFrame()
         
-        # Quality analysis
-        quality_analysis = {}
-        if not standardized_df.empty and 'name_quality_issues' in standardized_df.columns:
-            all_issues = []
-            for issues_str in standardized_df['name_quality_issues']:
-                if issues_str and issues_str != 'No issues':
-                    all_issues.extend(issues_str.split('; '))
-            
-            for issue in all_issues:
-                quality_analysis[issue] = quality_analysis.get(issue, 0) + 1
+        preview_data = self._name_preview(
+            summary, standardization_result['standardization_info'],
+            valid_count=valid_count,
+            invalid_count=invalid_count,
+            valid_samples=valid_sample.to_dict('records') if not valid_sample.empty else [],
+            invalid_samples=invalid_sample.to_dict('records') if not invalid_sample.empty else [],
+            columns=list(standardized_df.columns),
+            quality_analysis=self._name_quality_counts(standardized_df)
+        )
         
-        # File breakdown
+        self.debug_callback(f"✅ Name preview generated successfully", "NAME_PREVIEW")
+        return preview_data
+    
+    @staticmethod
+    def _name_quality_counts(standardized_df: pd.DataFrame) -> Dict[str, int]:
+        """Count every record's name quality issues in one vectorized pass (first-seen order kept)"""
+        if standardized_df.empty or 'name_quality_issues' not in standardized_df.columns:
+            return {}
+        issues = standardized_df['name_quality_issues']
+        issues = issues[issues.notna() & (issues != '') & (issues != 'No issues')]
+        return issues.str.split('; ').explode().value_counts(sort=False).to_dict()
+    
+    @staticmethod
+    def _name_preview(summary: Dict, standardization_info: List[Dict], valid_count: int, invalid_count: int,
+                      valid_samples: List[Dict], invalid_samples: List[Dict], columns: List[str],
+                      quality_analysis: Dict[str, int]) -> Dict:
+        """Name preview result from the standardization summary, row counts and sampled records"""
         file_breakdown = {}
-        standardization_info = standardization_result.get('standardization_info', [])
         for info in standardization_info:
             if 'error' not in info and 'parsing_summary' in info:
                 parsing_summary = info['parsing_summary']
@@ -228,7 +509,7 @@ class EnhancedValidationService:
                     'rate': parsing_summary['validation_rate']
                 }
         
-        preview_data = {
+        return {
             'success': True,
             'overview': {
                 'total_files': summary.get('total_files', 0),
@@ -240,22 +521,37 @@ class EnhancedValidationService:
                 'ready_for_validation': summary.get('ready_for_name_validation', False)
             },
             'valid_preview': {
-                'count': len(valid_df),
-                'sample_data': valid_sample.to_dict('records') if not valid_sample.empty else [],
-                'columns': list(valid_df.columns) if not valid_df.empty else []
+                'count': valid_count,
+                'sample_data': valid_samples,
+                'columns': columns if valid_count else []
             },
             'invalid_preview': {
-                'count': len(invalid_df),
-                'sample_data': invalid_sample.to_dict('records') if not invalid_sample.empty else [],
+                'count': invalid_count,
+                'sample_data': invalid_samples,
                 'quality_analysis': quality_analysis,
                 'top_issues': sorted(quality_analysis.items(), key=lambda x: x[1], reverse=True)[:5]
             },
             'file_breakdown': file_breakdown,
-            'standardization_info': standardization_result['standardization_info']
+            'standardization_info': standardization_info
+        }
+    
+    @staticmethod
+    def _name_pipeline_summary(files_processed: int, total_source_rows: int, standardization_result: Dict,
+                               validation_result: Dict) -> Dict:
+        """Summary block of a complete name pipeline result"""
+        processed = validation_result['processed_records']
+        return {
+            'files_processed': files_processed,
+            'total_source_rows': total_source_rows,
+            'parsed_names': standardization_result['total_rows'],
+            'valid_parsed_names': standardization_result['valid_names'],
+            'invalid_parsed_names': standardization_result['invalid_names'],
+            'validated_names': processed,
+            'successful_validations': validation_result['successful_validations'],
+            'failed_validations': validation_result['failed_validations'],
+            'parsing_success_rate': standardization_result['summary']['average_parsing_success_rate'],
+            'validation_success_rate': validation_result['successful_validations'] / processed if processed > 0 else 0
         }
-        
-        self.debug_callback(f"✅ Name preview generated successfully", "NAME_PREVIEW")
-        return preview_data
     
     def validate_parsed_names_batch(self, parsed_names_df: pd.DataFrame, include_suggestions: bool = True, 
                                   max_records: Optional[int] = None) -> Dict:
@@ -265,7 +561,7 @@ class EnhancedValidationService:
         
         if parsed_names_df.empty:
             return {
-                'timestamp': datetime.now(),
+                'timestamp': time.time(),  # epoch seconds; formatted only when displayed
                 'total_records': 0,
                 'processed_records': 0,
                 'successful_validations': 0,
@@ -275,30 +571,43 @@ class EnhancedValidationService:
                 'summary': {}
             }
         
-        # Convert to records and validate
-        validation_columns = ['first_name', 'last_name', 'middle_name', 'title', 'suffix', 'source_file', 'source_row_number']
-        available_columns = [col for col in validation_columns if col in parsed_names_df.columns]
-        records = parsed_names_df[available_columns].to_dict('records')
-        
         if max_records:
-            records = records[:max_records]
+            parsed_names_df = parsed_names_df.head(max_records)
         
         return self._validate_name_batch_records(
-            records=records,
+            columns=self._name_batch_columns(parsed_names_df),
             include_suggestions=include_suggestions,
             source_info={'parsed_names_only': True}
         )
     
-    def _validate_name_batch_records(self, records: List[Dict], include_suggestions: bool = True, 
-                                   source_info: Optional[Dict] = None) -> Dict:
-        """Internal batch name validation"""
+    @staticmethod
+    def _name_batch_columns(parsed_names_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Pull each name column out once as a stripped object array (missing values and columns read as '')"""
+        columns = {}
+        for col in NAME_TEXT_COLUMNS:
+            if col in parsed_names_df.columns:
+                columns[col] = parsed_names_df[col].fillna('').astype(str).str.strip().to_numpy(dtype=object)
+            else:
+                columns[col] = np.full(len(parsed_names_df), '', dtype=object)
+        columns['source_file'] = (parsed_names_df['source_file'].to_numpy(dtype=object)
+                                  if 'source_file' in parsed_names_df.columns
+                                  else np.full(len(parsed_names_df), 'unknown', dtype=object))
+        return columns
+    
+    def _validate_name_batch_records(self, columns: Dict[str, np.ndarray], include_suggestions: bool = True, 
+                                   source_info: Optional[Dict] = None, row_offset: int = 0) -> Dict:
+        """Internal batch name validation over parallel column arrays (see NAME_TEXT_COLUMNS).
+        
+        Record row numbers start at row_offset + 1.
+        """
         
-        self.debug_callback(f"📦 Batch name validation: {len(records)} records", "NAME_SERVICE")
-        batch_start = time.time()
+        total = len(columns['first_name'])
+        self.debug_callback(f"📦 Batch name validation: {total} records", "NAME_SERVICE")
+        batch_start = time.perf_counter()
         
         results = {
-            'timestamp': datetime.now(),
-            'total_records': len(records),
+            'timestamp': time.time(),  # epoch seconds; formatted only when displayed
+            'total_records': total,
             'processed_records': 0,
             'successful_validations': 0,
             'failed_validations': 0,
@@ -313,80 +622,122 @@ class EnhancedValidationService:
             }
         }
         
-        for i, record in enumerate(records):
+        self._prevalidate_names_in_parallel(columns['first_name'], columns['last_name'])
+        
+        # Each distinct (first, last) pair is validated and formatted once, and rows
+        # with no name at all never reach the validator
+        pair_codes, pairs = self._name_pair_codes(columns['first_name'], columns['last_name'])
+        pair_fields = []
+        for first_name, last_name in pairs:
             try:
-                # Extract name fields
-                first_name = str(record.get('first_name', '')).strip()
-                last_name = str(record.get('last_name', '')).strip()
-                middle_name = str(record.get('middle_name', '')).strip()
-                title = str(record.get('title', '')).strip()
-                suffix = str(record.get('suffix', '')).strip()
-                
-                # Validate the name
-                validation_result = self.name_validator.validate(first_name, last_name)
-                
-                # Build result record
-                record_result = {
-                    'row': i + 1,
-                    'source_file': record.get('source_file', 'unknown'),
-                    'first_name': first_name,
-                    'last_name': last_name,
-                    'middle_name': middle_name,
-                    'title': title,
-                    'suffix': suffix,
-                    'name_status': 'Valid' if validation_result['valid'] else 'Invalid',
-                    'confidence': f"{validation_result['confidence']:.1%}",
-                    'errors': '; '.join(validation_result.get('errors', [])),
-                    'warnings': '; '.join(validation_result.get('warnings', []))
-                }
-                
-                # Add suggestions if requested and available
-                if include_suggestions and validation_result.get('suggestions'):
-                    suggestions = validation_result['suggestions']
-                    
-                    if 'first_name' in suggestions and suggestions['first_name']:
-                        top_first = suggestions['first_name'][0]
-                        record_result['first_name_suggestion'] = f"{top_first['suggestion']} ({top_first['confidence']:.1%})"
-                        results['summary']['suggestions_provided'] += 1
-                    
-                    if 'last_name' in suggestions and suggestions['last_name']:
-                        top_last = suggestions['last_name'][0]
-                        record_result['last_name_suggestion'] = f"{top_last['suggestion']} ({top_last['confidence']:.1%})"
-                        results['summary']['suggestions_provided'] += 1
-                
-                # Update summary stats
-                analysis = validation_result.get('analysis', {})
-                if analysis.get('first_name', {}).get('is_common'):
-                    results['summary']['common_first_names'] += 1
-                if analysis.get('last_name', {}).get('is_common'):
-                    results['summary']['common_last_names'] += 1
-                if not analysis.get('first_name', {}).get('is_common') and not analysis.get('last_name', {}).get('is_common'):
-                    results['summary']['uncommon_names'] += 1
-                
-                results['records'].append(record_result)
-                results['processed_records'] += 1
-                
-                if validation_result['valid']:
-                    results['successful_validations'] += 1
+                if not first_name and not last_name:
+                    validation_result = self._empty_name_result
                 else:
-                    results['failed_validations'] += 1
-                
+                    validation_result = self._validate_name_cached(first_name, last_name)
+                pair_fields.append(self._name_result_fields(validation_result, include_suggestions))
             except Exception as e:
-                self.debug_callback(f"❌ Error validating name record {i + 1}: {e}", "NAME_SERVICE")
-                results['failed_validations'] += 1
-                results['processed_records'] += 1
+                self.debug_callback(f"❌ Error validating name '{first_name} {last_name}': {e}", "NAME_SERVICE")
+                pair_fields.append(None)
+        
+        records = results['records']
+        rows = zip(pair_codes.tolist(), columns['first_name'], columns['last_name'], columns['middle_name'],
+                   columns['title'], columns['suffix'], columns['source_file'])
+        
+        for i, (code, first_name, last_name, middle_name, title, suffix, source_file) in enumerate(rows, row_offset + 1):
+            fields = pair_fields[code]
+            if fields is None:
+                continue
+            
+            # Build result record
+            records.append({
+                'row': i,
+                'source_file': source_file,
+                'first_name': first_name,
+                'last_name': last_name,
+                'middle_name': middle_name,
+                'title': title,
+                'suffix': suffix,
+                **fields['columns']
+            })
+        
+        # Summary stats per distinct pair, weighted by its number of rows
+        summary = results['summary']
+        for fields, count in zip(pair_fields, np.bincount(pair_codes, minlength=len(pair_fields)).tolist()):
+            results['processed_records'] += count
+            if fields is None:
+                results['failed_validations'] += count
+                continue
+            if fields['valid']:
+                results['successful_validations'] += count
+            else:
+                results['failed_validations'] += count
+            summary['suggestions_provided'] += count * fields['suggestion_count']
+            if fields['common_first']:
+                summary['common_first_names'] += count
+            if fields['common_last']:
+                summary['common_last_names'] += count
+            if not fields['common_first'] and not fields['common_last']:
+                summary['uncommon_names'] += count
         
-        results['processing_time_ms'] = int((time.time() - batch_start) * 1000)
+        results['processing_time_ms'] = int((time.perf_counter() - batch_start) * 1000)
+        # Suggestion columns exist exactly when at least one suggestion was added
+        results['has_suggestions'] = results['summary']['suggestions_provided'] > 0
         self.debug_callback(f"✅ Batch name validation complete: {results['successful_validations']}/{results['processed_records']} successful", "NAME_SERVICE")
         
         return results
     
+    @staticmethod
+    def _name_pair_codes(first_names: np.ndarray, last_names: np.ndarray) -> Tuple[np.ndarray, List[Tuple[str, str]]]:
+        """Number the distinct (first, last) pairs in one vectorized pass: per-row pair codes and the pairs"""
+        first_codes, first_uniques = pd.factorize(first_names)
+        last_codes, last_uniques = pd.factorize(last_names)
+        pair_codes, pair_keys = pd.factorize(first_codes * len(last_uniques) + last_codes)
+        pairs = [(first_uniques[key // len(last_uniques)], last_uniques[key % len(last_uniques)]) for key in pair_keys.tolist()]
+        return pair_codes, pairs
+    
+    def _name_result_fields(self, validation_result: Dict, include_suggestions: bool) -> Dict:
+        """Result columns and summary flags for one name validation"""
+        columns = {
+            'name_status': 'Valid' if validation_result['valid'] else 'Invalid',
+            'confidence': f"{validation_result['confidence']:.1%}",
+            'errors': '; '.join(validation_result.get('errors', [])),
+            'warnings': '; '.join(validation_result.get('warnings', []))
+        }
+        suggestion_count = 0
+        
+        # Add suggestions if requested and available
+        if include_suggestions and validation_result.get('suggestions'):
+            suggestions = validation_result['suggestions']
+            
+            if 'first_name' in suggestions and suggestions['first_name']:
+                top_first = suggestions['first_name'][0]
+                columns['first_name_suggestion'] = f"{top_first['suggestion']} ({top_first['confidence']:.1%})"
+                suggestion_count += 1
+            
+            if 'last_name' in suggestions and suggestions['last_name']:
+                top_last = suggestions['last_name'][0]
+                columns['last_name_suggestion'] = f"{top_last['suggestion']} ({top_last['confidence']:.1%})"
+                suggestion_count += 1
+        
+        analysis = validation_result.get('analysis', {})
+        return {
+            'columns': columns,
+            'valid': validation_result['valid'],
+            'suggestion_count': suggestion_count,
+            'common_first': bool(analysis.get('first_name', {}).get('is_common')),
+            'common_last': bool(analysis.get('last_name', {}).get('is_common'))
+        }
+    
     def process_complete_name_validation_pipeline(self, file_data_list: List[Tuple[pd.DataFrame, str]], 
-                                                include_suggestions: bool = True, max_records: Optional[int] = None) -> Dict:
-        """Complete name validation pipeline: parsing → preview → validation"""
+                                                include_suggestions: bool = True, max_records: Optional[int] = None,
+                                                total_source_rows: Optional[int] = None) -> Dict:
+        """Complete name validation pipeline: parsing → preview → validation
+        
+        total_source_rows can be passed when the caller already counted the input rows.
+        """
         
         self.debug_callback(f"🚀 COMPLETE NAME PIPELINE for {len(file_data_list)} files", "NAME_PIPELINE")
-        pipeline_start = time.time()
+        pipeline_start = time.perf_counter()
         
         try:
             # Step 1: Name standardization and parsing
@@ -434,7 +785,7 @@ class EnhancedValidationService:
                 )
             
             # Step 4: Combine results
-            total_duration = int((time.time() - pipeline_start) * 1000)
+            total_duration = int((time.perf_counter() - pipeline_start) * 1000)
             performance_tracker.track("complete_name_pipeline", total_duration, True)
             
             combined_result = {
@@ -443,18 +794,11 @@ class EnhancedValidationService:
                 'standardization': standardization_result,
                 'preview': preview_result,
                 'validation': validation_result,
-                'summary': {
-                    'files_processed': len(file_data_list),
-                    'total_source_rows': sum(len(df) for df, _ in file_data_list),
-                    'parsed_names': standardization_result['total_rows'],
-                    'valid_parsed_names': standardization_result['valid_names'],
-                    'invalid_parsed_names': standardization_result['invalid_names'],
-                    'validated_names': validation_result['processed_records'],
-                    'successful_validations': validation_result['successful_validations'],
-                    'failed_validations': validation_result['failed_validations'],
-                    'parsing_success_rate': standardization_result['summary']['average_parsing_success_rate'],
-                    'validation_success_rate': validation_result['successful_validations'] / validation_result['processed_records'] if validation_result['processed_records'] > 0 else 0
-                }
+                'summary': self._name_pipeline_summary(
+                    len(file_data_list),
+                    total_source_rows if total_source_rows is not None else sum(len(df) for df, _ in file_data_list),
+                    standardization_result, validation_result
+                )
             }
             
             self.debug_callback(f"🎉 COMPLETE NAME PIPELINE FINISHED ({total_duration}ms)", "NAME_PIPELINE")
@@ -464,7 +808,168 @@ class EnhancedValidationService:
             error_msg = f"Name pipeline failed: {str(e)}"
             self.debug_callback(f"❌ {error_msg}", "NAME_PIPELINE")
             
-            total_duration = int((time.time() - pipeline_start) * 1000)
+            total_duration = int((time.perf_counter() - pipeline_start) * 1000)
+            performance_tracker.track("complete_name_pipeline", total_duration, False)
+            
+            return {
+                'success': False,
+                'error': error_msg,
+                'pipeline_duration_ms': total_duration,
+                'stage': 'unknown'
+            }
+    
+    def process_name_pipeline_fused(self, file_data_list: List[Tuple[pd.DataFrame, str]],
+                                    include_suggestions: bool = True, max_records: Optional[int] = None,
+                                    total_source_rows: Optional[int] = None) -> Dict:
+        """Complete name pipeline in one pass per file: each parsed file is sampled for the preview
+        and validated in turn, so the combined parsed DataFrame is never built.
+        
+        Returns the same shape as process_complete_name_validation_pipeline, except that
+        'standardization' carries no standardized_data.
+        """
+        
+        self.debug_callback(f"🚀 FUSED NAME PIPELINE for {len(file_data_list)} files", "NAME_PIPELINE")
+        pipeline_start = time.perf_counter()
+        
+        try:
+            # Parsing goes through the standardizer's file fan-out (worker processes for large batches)
+            parse_start = time.perf_counter()
+            parsed = self.name_standardizer._standardize_files(file_data_list)
+            parsing_time_ms = int((time.perf_counter() - parse_start) * 1000)
+            
+            standardization_info = []
+            for (_, file_name), result in zip(file_data_list, parsed):
+                if isinstance(result, Exception):
+                    self.debug_callback(f"❌ Failed: {file_name} - {result}", "NAME_PIPELINE")
+                    standardization_info.append({'file_name': file_name, 'error': str(result), 'status': 'failed'})
+                else:
+                    standardization_info.append(result[1])
+            
+            # Same source_file categories and preview columns as the combined frame would have
+            parsed_files = [(i, result[0]) for i, result in enumerate(parsed)
+                            if not isinstance(result, Exception) and not result[0].empty]
+            source_categories = list(dict.fromkeys(file_data_list[i][1] for i, _ in parsed_files))
+            preview_columns = list(dict.fromkeys(
+                col for _, std_df in parsed_files
+                for col in [*std_df.columns, 'source_file', 'source_row_number']
+            ))
+            
+            parsed_names = 0
+            valid_names = 0
+            valid_samples = []
+            invalid_samples = []
+            quality_analysis = {}
+            validation_result = {
+                'timestamp': time.time(),  # epoch seconds; formatted only when displayed
+                'total_records': 0,
+                'processed_records': 0,
+                'successful_validations': 0,
+                'failed_validations': 0,
+                'processing_time_ms': 0,
+                'records': [],
+                'source_info': {'parsed_names_only': True},
+                'summary': {'common_first_names': 0, 'common_last_names': 0, 'uncommon_names': 0, 'suggestions_provided': 0},
+                'has_suggestions': False
+            }
+            remaining = max_records or None
+            
+            for i, std_df in parsed_files:
+                # Drop the pool's reference so each parsed file is freed once handled
+                parsed[i] = None
+                std_df['source_row_number'] = range(1, len(std_df) + 1)
+                std_df.insert(
+                    std_df.columns.get_loc('source_row_number'), 'source_file',
+                    pd.Categorical.from_codes(
+                        np.full(len(std_df), source_categories.index(file_data_list[i][1])), categories=source_categories
+                    )
+                )
+                
+                # Preview: counts, the first 10 rows on each side and issue totals
+                mask = (std_df['name_valid'].to_numpy(dtype=bool, na_value=False) if 'name_valid' in std_df.columns
+                        else np.ones(len(std_df), dtype=bool))
+                parsed_names += len(std_df)
+                valid_names += int(mask.sum())
+                if len(valid_samples) < 10:
+                    valid_samples += (std_df.iloc[np.flatnonzero(mask)[:10 - len(valid_samples)]]
+                                      .reindex(columns=preview_columns).to_dict('records'))
+                if len(invalid_samples) < 10:
+                    invalid_samples += (std_df.iloc[np.flatnonzero(~mask)[:10 - len(invalid_samples)]]
+                                        .reindex(columns=preview_columns).to_dict('records'))
+                for issue, count in self._name_quality_counts(std_df).items():
+                    quality_analysis[issue] = quality_analysis.get(issue, 0) + count
+                
+                # Validation of this file's rows (max_records counts across files, as in the combined pipeline)
+                if remaining is not None:
+                    if remaining <= 0:
+                        continue
+                    std_df = std_df.head(remaining)
+                    remaining -= len(std_df)
+                batch_result = self._validate_name_batch_records(
+                    columns=self._name_batch_columns(std_df),
+                    include_suggestions=include_suggestions,
+                    source_info={'parsed_names_only': True},
+                    row_offset=validation_result['total_records']
+                )
+                validation_result['records'] += batch_result['records']
+                for key in ('total_records', 'processed_records', 'successful_validations', 'failed_validations', 'processing_time_ms'):
+                    validation_result[key] += batch_result[key]
+                for key in validation_result['summary']:
+                    validation_result['summary'][key] += batch_result['summary'][key]
+                validation_result['has_suggestions'] = validation_result['has_suggestions'] or batch_result['has_suggestions']
+            
+            if not parsed_names:
+                return {
+                    'success': False,
+                    'error': 'Name standardization failed: No data could be standardized',
+                    'stage': 'standardization'
+                }
+            
+            summary = self.name_standardizer.get_name_standardization_summary(standardization_info)
+            performance_tracker.track("name_standardization_parsing", parsing_time_ms, summary['successful_files'] > 0)
+            standardization_result = {
+                'success': True,
+                'standardization_info': standardization_info,
+                'summary': summary,
+                'processing_time_ms': parsing_time_ms,
+                'total_rows': parsed_names,
+                'valid_names': summary['valid_records'],
+                'invalid_names': summary['invalid_records']
+            }
+            
+            preview_result = self._name_preview(
+                summary, standardization_info,
+                valid_count=valid_names,
+                invalid_count=parsed_names - valid_names,
+                valid_samples=valid_samples,
+                invalid_samples=invalid_samples,
+                columns=preview_columns,
+                quality_analysis=quality_analysis
+            )
+            
+            total_duration = int((time.perf_counter() - pipeline_start) * 1000)
+            performance_tracker.track("complete_name_pipeline", total_duration, True)
+            
+            combined_result = {
+                'success': True,
+                'pipeline_duration_ms': total_duration,
+                'standardization': standardization_result,
+                'preview': preview_result,
+                'validation': validation_result,
+                'summary': self._name_pipeline_summary(
+                    len(file_data_list),
+                    total_source_rows if total_source_rows is not None else sum(len(df) for df, _ in file_data_list),
+                    standardization_result, validation_result
+                )
+            }
+            
+            self.debug_callback(f"🎉 FUSED NAME PIPELINE FINISHED ({total_duration}ms)", "NAME_PIPELINE")
+            return combined_result
+            
+        except Exception as e:
+            error_msg = f"Name pipeline failed: {str(e)}"
+            self.debug_callback(f"❌ {error_msg}", "NAME_PIPELINE")
+            
+            total_duration = int((time.perf_counter() - pipeline_start) * 1000)
             performance_tracker.track("complete_name_pipeline", total_duration, False)
             
             return {
@@ -479,7 +984,7 @@ class EnhancedValidationService:
     def standardize_and_qualify_csv_files(self, file_data_list: List[Tuple[pd.DataFrame, str]]) -> Dict:
         """Existing address standardization method - preserved"""
         self.debug_callback(f"📦 STARTING address standardization for {len(file_data_list)} files", "ADDRESS_STANDARDIZATION")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             standardized_df, standardization_info = self.address_standardizer.standardize_multiple_files(file_data_list)
@@ -489,7 +994,7 @@ class EnhancedValidationService:
                 return {
                     'success': False,
                     'error': 'No data could be standardized',
-                    'processing_time_ms': int((time.time() - start_time) * 1000),
+                    'processing_time_ms': int((time.perf_counter() - start_time) * 1000),
                     'total_rows': 0,
                     'qualified_rows': 0,
                     'disqualified_rows': 0
@@ -500,34 +1005,37 @@ class EnhancedValidationService:
                 return {
                     'success': False,
                     'error': 'Qualification assessment failed during standardization',
-                    'processing_time_ms': int((time.time() - start_time) * 1000),
+                    'processing_time_ms': int((time.perf_counter() - start_time) * 1000),
                     'total_rows': len(standardized_df),
                     'qualified_rows': 0,
                     'disqualified_rows': 0
                 }
             
-            qualified_df = standardized_df[standardized_df['us_qualified'] == True].copy()
-            disqualified_df = standardized_df[standardized_df['us_qualified'] == False].copy()
+            # Boolean masks instead of qualified/disqualified copies; qualified_data/disqualified_data slice on access
+            qualified_mask = standardized_df['us_qualified'].to_numpy(dtype=bool, na_value=False)
+            qualified_rows = int(qualified_mask.sum())
             
             summary = self.address_standardizer.get_standardization_summary(standardization_info)
             qualification_summary = self.address_standardizer.get_qualification_summary(standardized_df, standardization_info)
             
-            duration = int((time.time() - start_time) * 1000)
+            duration = int((time.perf_counter() - start_time) * 1000)
             performance_tracker.track("address_standardization_qualification", duration, summary['successful_files'] > 0)
             
-            result = {
+            result = QualificationResult({
                 'success': True,
                 'standardized_data': standardized_df,
-                'qualified_data': qualified_df,
-                'disqualified_data': disqualified_df,
+                # Input rows per the standardization info, so later stages never revisit the input frames
+                'total_source_rows': sum(info.get('row_count', 0) for info in standardization_info),
+                'qualified_mask': qualified_mask,
+                'disqualified_mask': ~qualified_mask,
                 'standardization_info': standardization_info,
                 'summary': summary,
                 'qualification_summary': qualification_summary,
                 'processing_time_ms': duration,
                 'total_rows': len(standardized_df),
-                'qualified_rows': len(qualified_df),
-                'disqualified_rows': len(disqualified_df)
-            }
+                'qualified_rows': qualified_rows,
+                'disqualified_rows': len(standardized_df) - qualified_rows
+            })
             
             self.debug_callback(f"✅ ADDRESS STANDARDIZATION COMPLETE ({duration}ms)", "ADDRESS_STANDARDIZATION")
             return result
@@ -536,7 +1044,7 @@ class EnhancedValidationService:
             error_msg = f"Address standardization failed: {str(e)}"
             self.debug_callback(f"❌ {error_msg}", "ADDRESS_STANDARDIZATION")
             
-            duration = int((time.time() - start_time) * 1000)
+            duration = int((time.perf_counter() - start_time) * 1000)
             performance_tracker.track("address_standardization_qualification", duration, False)
             
             return {
@@ -548,9 +1056,159 @@ class EnhancedValidationService:
                 'disqualified_rows': 0
             }
     
+    def generate_comprehensive_preview(self, standardization_result: Dict) -> Dict:
+        """Generate preview of address standardization and US qualification results"""
+        
+        self.debug_callback("📋 Generating address qualification preview", "ADDRESS_PREVIEW")
+        
+        if not standardization_result['success']:
+            return {
+                'success': False,
+                'error': standardization_result.get('error', 'Unknown error')
+            }
+        
+        standardized_df = standardization_result['standardized_data']
+        qualified_mask = standardization_result['qualified_mask']
+        disqualified_mask = standardization_result['disqualified_mask']
+        qualification_summary = standardization_result['qualification_summary']
+        
+        # Only counts and the first 10 rows of each side are needed, so the filtered frames are never built
+        qualified_sample = standardized_df.iloc[np.flatnonzero(qualified_mask)[:10]]
+        disqualified_sample = standardized_df.iloc[np.flatnonzero(disqualified_mask)[:10]]
+        
+        # Error analysis: split and count every disqualified row's errors in one vectorized pass
+        error_counts = pd.Series(dtype=int)
+        if 'qualification_errors' in standardized_df.columns:
+            errors = standardized_df['qualification_errors'][disqualified_mask].dropna()
+            errors = errors[errors != '']
+            if not errors.empty:
+                error_counts = errors.str.split('; ').explode().value_counts()
+        error_analysis = {error: int(count) for error, count in error_counts.items()}
+        
+        # File breakdown
+        file_breakdown = {}
+        for info in standardization_result.get('standardization_info', []):
+            if 'error' not in info and 'qualification_summary' in info:
+                file_summary = info['qualification_summary']
+                file_breakdown[info['file_name']] = {
+                    'total': file_summary['total_rows'],
+                    'qualified': file_summary['qualified_rows'],
+                    'rate': file_summary['qualification_rate']
+                }
+        
+        preview_data = {
+            'success': True,
+            'overview': {
+                'total_files': qualification_summary.get('total_files', 0),
+                'total_rows': standardization_result['total_rows'],
+                'qualified_rows': standardization_result['qualified_rows'],
+                'disqualified_rows': standardization_result['disqualified_rows'],
+                'qualification_rate': qualification_summary.get('qualification_rate', 0),
+                'ready_for_usps': qualification_summary.get('ready_for_usps', False)
+            },
+            'qualified_preview': {
+                'count': standardization_result['qualified_rows'],
+                'sample_data': qualified_sample.to_dict('records'),
+                'columns': list(standardized_df.columns)
+            },
+            'disqualified_preview': {
+                'count': standardization_result['disqualified_rows'],
+                'sample_data': disqualified_sample.to_dict('records'),
+                'error_analysis': error_analysis,
+                # value_counts is already sorted by count, descending
+                'top_errors': list(error_analysis.items())[:5]
+            },
+            'file_breakdown': file_breakdown,
+            'standardization_info': standardization_result['standardization_info']
+        }
+        
+        self.debug_callback("✅ Address preview generated successfully", "ADDRESS_PREVIEW")
+        return preview_data
+    
+    def process_complete_pipeline_with_preview(self, file_data_list: List[Tuple[pd.DataFrame, str]],
+                                               include_suggestions: bool = True, max_records: Optional[int] = None) -> Dict:
+        """Complete address pipeline: standardization and qualification → preview → USPS validation
+        
+        include_suggestions is accepted for parity with the name pipeline; address results carry none.
+        """
+        
+        self.debug_callback(f"🚀 COMPLETE ADDRESS PIPELINE for {len(file_data_list)} files", "ADDRESS_PIPELINE")
+        pipeline_start = time.perf_counter()
+        
+        try:
+            # Step 1: Standardization and US qualification
+            self.debug_callback("📋 STEP 1: Address standardization and qualification", "ADDRESS_PIPELINE")
+            standardization_result = self.standardize_and_qualify_csv_files(file_data_list)
+            
+            if not standardization_result['success']:
+                return {
+                    'success': False,
+                    'error': 'Address standardization failed: ' + standardization_result.get('error', 'Unknown'),
+                    'stage': 'standardization'
+                }
+            
+            # Step 2: Generate preview
+            self.debug_callback("📋 STEP 2: Generate preview", "ADDRESS_PIPELINE")
+            preview_result = self.generate_comprehensive_preview(standardization_result)
+            
+            if not preview_result['success']:
+                return {
+                    'success': False,
+                    'error': 'Preview failed: ' + preview_result.get('error', 'Unknown'),
+                    'stage': 'preview'
+                }
+            
+            # Step 3: USPS validation of qualified addresses
+            self.debug_callback(f"🔍 STEP 3: USPS validation of {standardization_result['qualified_rows']} qualified addresses", "ADDRESS_PIPELINE")
+            validation_result = self.validate_qualified_addresses(standardization_result, max_records=max_records)
+            
+            # Step 4: Combine results
+            total_duration = int((time.perf_counter() - pipeline_start) * 1000)
+            performance_tracker.track("complete_address_pipeline", total_duration, True)
+            
+            combined_result = {
+                'success': True,
+                'pipeline_duration_ms': total_duration,
+                'standardization': standardization_result,
+                'preview': preview_result,
+                'validation': validation_result,
+                'summary': {
+                    'files_processed': len(file_data_list),
+                    'total_source_rows': standardization_result['total_source_rows'],
+                    'standardized_rows': standardization_result['total_rows'],
+                    'qualified_rows': standardization_result['qualified_rows'],
+                    'disqualified_rows': standardization_result['disqualified_rows'],
+                    'validated_rows': validation_result['processed_records'],
+                    'successful_validations': validation_result['successful_validations'],
+                    'failed_validations': validation_result['failed_validations'],
+                    'validation_success_rate': validation_result['successful_validations'] / validation_result['processed_records'] if validation_result['processed_records'] > 0 else 0
+                }
+            }
+            
+            self.debug_callback(f"🎉 COMPLETE ADDRESS PIPELINE FINISHED ({total_duration}ms)", "ADDRESS_PIPELINE")
+            return combined_result
+            
+        except Exception as e:
+            error_msg = f"Address pipeline failed: {str(e)}"
+            self.debug_callback(f"❌ {error_msg}", "ADDRESS_PIPELINE")
+            
+            total_duration = int((time.perf_counter() - pipeline_start) * 1000)
+            performance_tracker.track("complete_address_pipeline", total_duration, False)
+            
+            return {
+                'success': False,
+                'error': error_msg,
+                'pipeline_duration_ms': total_duration,
+                'stage': 'unknown'
+            }
+    
     def get_service_status(self) -> Dict:
-        """Get enhanced service status"""
-        return {
+        """Get enhanced service status (snapshots are reused for SERVICE_STATUS_TTL_SECONDS)"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < SERVICE_STATUS_TTL_SECONDS:
+            return self._status_cache[1]
+        
+        status = {
             'name_validation_available': self.is_name_validation_available(),
             'name_parsing_available': True,
             'address_validation_available': self.is_address_validation_available(),
@@ -563,4 +1221,10 @@ class EnhancedValidationService:
             'performance_tracking': True,
             'debug_logging': True,
             'service_uptime': datetime.now().isoformat()
-        }
\ No newline at end of file
+        }
+        self._status_cache = (now, status)
+        return status
+
+
+# Name the services package loads from every implementation module
+ValidationService = EnhancedValidationService
\ No newline at end of file
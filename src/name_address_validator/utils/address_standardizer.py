@@ -10,6 +10,8 @@ import re
 from typing import Dict, List, Tuple, Optional, Any
 import numpy as np
 
+from .column_matching import compile_column_patterns, match_columns
+
 try:
     from fuzzywuzzy import fuzz
 except ImportError:
@@ -53,6 +55,7 @@ class AddressFormatStandardizer:
             'state': ['state', 'st', 'state_code', 'province', 'region'],
             'zip_code': ['zip_code', 'zip', 'zipcode', 'postal_code', 'postcode', 'postal']
         }
+        self._column_pattern, self._variation_rank = compile_column_patterns(self.column_mappings)
         
         # US States
         self.us_states = {
@@ -93,18 +96,10 @@ class AddressFormatStandardizer:
         """Detect column mappings with enhanced combined address detection"""
         self.log(f"🔍 Detecting columns in: {list(df.columns)}")
         
-        detected_mapping = {}
-        
-        # Direct matching first
-        for standard_col, variations in self.column_mappings.items():
-            for variation in variations:
-                for actual_col in df.columns:
-                    if actual_col.lower().strip() == variation:
-                        detected_mapping[standard_col] = actual_col
-                        self.log(f"✅ Exact match: {standard_col} -> {actual_col}")
-                        break
-                if standard_col in detected_mapping:
-                    break
+        # Direct matching first (one precompiled pass over the columns)
+        detected_mapping = match_columns(df.columns, self._column_pattern, self._variation_rank, self.column_mappings)
+        for standard_col, actual_col in detected_mapping.items():
+            self.log(f"✅ Exact match: {standard_col} -> {actual_col}")
         
         # Check for combined address fields - ENHANCED DETECTION
         self._detect_combined_address_fields(df, detected_mapping)
@@ -637,6 +632,7 @@ class AddressFormatStandardizer:
         
         all_dfs = []
         all_info = []
+        source_files = []
         
         for i, (df, filename) in enumerate(file_data_list):
             self.log(f"📄 File {i+1}: {filename}")
@@ -644,18 +640,19 @@ class AddressFormatStandardizer:
             try:
                 std_df, std_info = self.standardize_dataframe(df, filename)
                 
-                # Add source info
-                std_df['source_file'] = filename
+                # Add source info (source_file is filled in once after combining)
                 std_df['source_row_number'] = range(1, len(std_df) + 1)
                 
                 all_dfs.append(std_df)
                 all_info.append(std_info)
+                source_files.append(filename)
                 
             except Exception as e:
                 error_info = {
                     'file_name': filename,
                     'error': str(e),
-                    'status': 'failed'
+                    'status': 'failed',
+                    'row_count': len(df)
                 }
                 all_info.append(error_info)
                 self.log(f"❌ Failed: {filename} - {e}")
@@ -663,6 +660,14 @@ class AddressFormatStandardizer:
         # Combine all DataFrames
         if all_dfs:
             combined_df = pd.concat(all_dfs, ignore_index=True)
+            
+            # One categorical source label over the combined frame instead of a string per row
+            categories = list(dict.fromkeys(source_files))
+            codes = np.repeat([categories.index(name) for name in source_files], [len(d) for d in all_dfs])
+            combined_df.insert(
+                combined_df.columns.get_loc('source_row_number'), 'source_file',
+                pd.Categorical.from_codes(codes, categories=categories)
+            )
             self.log(f"🎉 COMBINED: {len(combined_df)} total rows")
         else:
             combined_df = pd.DataFrame()
@@ -683,7 +688,7 @@ class AddressFormatStandardizer:
             }
         
         total_rows = len(standardized_df)
-        qualified_rows = len(standardized_df[standardized_df['us_qualified'] == True])
+        qualified_rows = int(standardized_df['us_qualified'].to_numpy(dtype=bool, na_value=False).sum())
         
         return {
             'total_files': len(standardization_info_list),
@@ -700,8 +705,10 @@ class AddressFormatStandardizer:
         if standardized_df.empty:
             return pd.DataFrame(), pd.DataFrame()
         
-        qualified_df = standardized_df[standardized_df['us_qualified'] == True].copy()
-        disqualified_df = standardized_df[standardized_df['us_qualified'] == False].copy()
+        # One boolean mask; no defensive copies, callers only read the two frames
+        mask = standardized_df['us_qualified'].to_numpy(dtype=bool, na_value=False)
+        qualified_df = standardized_df.loc[mask]
+        disqualified_df = standardized_df.loc[~mask]
         
         return qualified_df, disqualified_df
     
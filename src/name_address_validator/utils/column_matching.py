@@ -0,0 +1,46 @@
+# src/name_address_validator/utils/column_matching.py
+"""
+Precompiled column-name matching shared by the name and address standardizers
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def compile_column_patterns(column_mappings: Dict[str, List[str]]) -> Tuple[re.Pattern, Dict[str, int]]:
+    """
+    Build one anchored alternation with a named group per standard column,
+    plus each variation's priority (its position in the mapping list)
+    """
+    groups = []
+    variation_rank = {}
+
+    for standard_col, variations in column_mappings.items():
+        groups.append(f"(?P<{standard_col}>{'|'.join(re.escape(v) for v in variations)})")
+        for rank, variation in enumerate(variations):
+            variation_rank.setdefault(variation, rank)
+
+    return re.compile('|'.join(groups)), variation_rank
+
+
+def match_columns(columns: Iterable[Any], pattern: re.Pattern, variation_rank: Dict[str, int],
+                  column_mappings: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Map standard columns to actual DataFrame columns in a single pass.
+
+    For each standard column the highest-priority variation wins, and the
+    first matching column wins among equals - the same result as scanning
+    every variation against every column.
+    """
+    best = {}
+
+    for actual_col in columns:
+        normalized = str(actual_col).lower().strip()
+        match = pattern.fullmatch(normalized)
+        if match:
+            standard_col = match.lastgroup
+            rank = variation_rank[normalized]
+            if standard_col not in best or rank < best[standard_col][0]:
+                best[standard_col] = (rank, actual_col)
+
+    return {standard_col: best[standard_col][1] for standard_col in column_mappings if standard_col in best}
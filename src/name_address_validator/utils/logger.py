@@ -4,10 +4,16 @@ Enhanced logging utilities for the name and address validator
 """
 
 import streamlit as st
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 import json
 
+def _format_ts(timestamp_ns: int, fmt: str) -> str:
+    """Format an epoch-nanosecond log timestamp"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).strftime(fmt)
+
+
 class DebugLogger:
     """Enhanced debug logger with performance tracking and categorization"""
     
@@ -22,7 +28,7 @@ class DebugLogger:
             return
             
         log_entry = {
-            'timestamp': datetime.now(),
+            'timestamp': time.time_ns(),  # epoch ns; formatted only when displayed
             'level': level.upper(),
             'category': category.upper(), 
             'message': message,
@@ -36,7 +42,7 @@ class DebugLogger:
             self.logs = self.logs[-self.max_logs:]
         
         # Also log to console for server-side monitoring
-        timestamp = log_entry['timestamp'].strftime("%H:%M:%S")
+        timestamp = _format_ts(log_entry['timestamp'], "%H:%M:%S")
         print(f"[{timestamp}] {level.upper()} {category}: {message}")
     
     def info(self, message: str, category: str = "GENERAL", **kwargs):
@@ -65,9 +71,8 @@ class DebugLogger:
     
     def get_recent_logs(self, minutes: int = 5) -> List[Dict]:
         """Get logs from the last N minutes"""
-        from datetime import timedelta
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        return [log for log in self.logs if log['timestamp'] > cutoff_time]
+        cutoff_ns = time.time_ns() - minutes * 60 * 1_000_000_000
+        return [log for log in self.logs if log['timestamp'] > cutoff_ns]
     
     def clear(self):
         """Clear all logs"""
@@ -87,7 +92,7 @@ class DebugLogger:
                 writer.writeheader()
                 for log in self.logs:
                     writer.writerow({
-                        'timestamp': log['timestamp'].isoformat(),
+                        'timestamp': datetime.fromtimestamp(log['timestamp'] / 1e9).isoformat(),
                         'level': log['level'],
                         'category': log['category'],
                         'message': log['message'],
@@ -98,7 +103,7 @@ class DebugLogger:
             # Plain text format
             lines = []
             for log in self.logs:
-                timestamp = log['timestamp'].strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = _format_ts(log['timestamp'], "%Y-%m-%d %H:%M:%S")
                 line = f"[{timestamp}] {log['level']} {log['category']}: {log['message']}"
                 if log['details']:
                     line += f" | {json.dumps(log['details'])}"
@@ -157,7 +162,7 @@ class DebugLogger:
             if filtered_logs:
                 log_text = []
                 for log in filtered_logs[-50:]:  # Show last 50 logs
-                    timestamp = log['timestamp'].strftime("%H:%M:%S.%f")[:-3]
+                    timestamp = _format_ts(log['timestamp'], "%H:%M:%S.%f")[:-3]
                     details_str = ""
                     if log['details']:
                         details_str = f" | {json.dumps(log['details'], default=str)}"
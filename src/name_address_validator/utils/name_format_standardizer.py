@@ -6,9 +6,14 @@ Handles various name formats and converts them to standardized first_name/last_n
 
 import pandas as pd
 import re
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any
 import numpy as np
 
+from .column_matching import compile_column_patterns, match_columns
+
 try:
     # Try to use nameparser if available (install with: pip install nameparser)
     from nameparser import HumanName
@@ -23,6 +28,27 @@ except ImportError:
     FUZZYWUZZY_AVAILABLE = False
 
 
+# Below this many rows in total, worker start-up costs more than parsing files in turn
+PARALLEL_MIN_ROWS = 50_000
+
+
+def _standardize_file_in_worker(df: pd.DataFrame, file_name: str) -> Tuple[Any, List[Tuple[str, str]]]:
+    """Process-pool entry point: standardize one file with a fresh standardizer.
+    
+    Returns the (std_df, std_info) tuple or raised exception, plus the (message, category)
+    log records made along the way so the parent can replay them to its debug callback.
+    """
+    logs = []
+    standardizer = NameFormatStandardizer()
+    # Attached after construction so the worker's own start-up message isn't replayed
+    standardizer.debug_callback = lambda message, category="NAME_STANDARDIZER": logs.append((message, category))
+    try:
+        result = standardizer.standardize_name_dataframe(df, file_name)
+    except Exception as e:
+        result = e
+    return result, logs
+
+
 class NameFormatStandardizer:
     """
     Enhanced name format standardizer with AI-like intelligent parsing
@@ -61,6 +87,7 @@ class NameFormatStandardizer:
                 'suffix', 'name_suffix', 'generation', 'jr_sr', 'degree'
             ]
         }
+        self._column_pattern, self._variation_rank = compile_column_patterns(self.name_column_mappings)
         
         # Common name prefixes/titles
         self.prefixes = {
@@ -93,18 +120,10 @@ class NameFormatStandardizer:
         """Detect name column mappings with enhanced logic"""
         self.log(f"🔍 Detecting name columns in: {list(df.columns)}")
         
-        detected_mapping = {}
-        
-        # Direct matching first
-        for standard_col, variations in self.name_column_mappings.items():
-            for variation in variations:
-                for actual_col in df.columns:
-                    if actual_col.lower().strip() == variation:
-                        detected_mapping[standard_col] = actual_col
-                        self.log(f"✅ Exact match: {standard_col} -> {actual_col}")
-                        break
-                if standard_col in detected_mapping:
-                    break
+        # Direct matching first (one precompiled pass over the columns)
+        detected_mapping = match_columns(df.columns, self._column_pattern, self._variation_rank, self.name_column_mappings)
+        for standard_col, actual_col in detected_mapping.items():
+            self.log(f"✅ Exact match: {standard_col} -> {actual_col}")
         
         # Check for combined name fields if no separate first/last found
         if 'first_name' not in detected_mapping or 'last_name' not in detected_mapping:
@@ -540,16 +559,17 @@ class NameFormatStandardizer:
     
     def _generate_parsing_summary(self, df: pd.DataFrame) -> Dict:
         """Generate summary of parsing results"""
+        valid_count = int(df['name_valid'].to_numpy(dtype=bool, na_value=False).sum()) if 'name_valid' in df.columns else 0
         summary = {
             'total_records': len(df),
-            'valid_names': len(df[df['name_valid'] == True]) if 'name_valid' in df.columns else 0,
-            'invalid_names': len(df[df['name_valid'] == False]) if 'name_valid' in df.columns else 0,
+            'valid_names': valid_count,
+            'invalid_names': len(df) - valid_count if 'name_valid' in df.columns else 0,
             'average_quality_score': df['name_quality_score'].mean() if 'name_quality_score' in df.columns else 0,
-            'has_first_name': len(df[df['first_name'].str.strip() != '']),
-            'has_last_name': len(df[df['last_name'].str.strip() != '']),
-            'has_middle_name': len(df[df['middle_name'].str.strip() != '']),
-            'has_title': len(df[df['title'].str.strip() != '']),
-            'has_suffix': len(df[df['suffix'].str.strip() != ''])
+            'has_first_name': int((df['first_name'].str.strip() != '').sum()),
+            'has_last_name': int((df['last_name'].str.strip() != '').sum()),
+            'has_middle_name': int((df['middle_name'].str.strip() != '').sum()),
+            'has_title': int((df['title'].str.strip() != '').sum()),
+            'has_suffix': int((df['suffix'].str.strip() != '').sum())
         }
         
         summary['validation_rate'] = summary['valid_names'] / summary['total_records'] if summary['total_records'] > 0 else 0
@@ -562,19 +582,24 @@ class NameFormatStandardizer:
         
         all_dfs = []
         all_info = []
+        source_files = []
+        
+        results = self._standardize_files(file_data_list)
         
-        for i, (df, filename) in enumerate(file_data_list):
+        for i, ((df, filename), result) in enumerate(zip(file_data_list, results)):
             self.log(f"📄 File {i+1}: {filename}")
             
             try:
-                std_df, std_info = self.standardize_name_dataframe(df, filename)
+                if isinstance(result, Exception):
+                    raise result
+                std_df, std_info = result
                 
-                # Add source info
-                std_df['source_file'] = filename
+                # Add source info (source_file is filled in once after combining)
                 std_df['source_row_number'] = range(1, len(std_df) + 1)
                 
                 all_dfs.append(std_df)
                 all_info.append(std_info)
+                source_files.append(filename)
                 
             except Exception as e:
                 error_info = {
@@ -588,12 +613,57 @@ class NameFormatStandardizer:
         # Combine all DataFrames
         if all_dfs:
             combined_df = pd.concat(all_dfs, ignore_index=True)
+            
+            # One categorical source label over the combined frame instead of a string per row
+            categories = list(dict.fromkeys(source_files))
+            codes = np.repeat([categories.index(name) for name in source_files], [len(d) for d in all_dfs])
+            combined_df.insert(
+                combined_df.columns.get_loc('source_row_number'), 'source_file',
+                pd.Categorical.from_codes(codes, categories=categories)
+            )
             self.log(f"🎉 COMBINED: {len(combined_df)} total name records")
         else:
             combined_df = pd.DataFrame()
         
         return combined_df, all_info
     
+    def _standardize_files(self, file_data_list: List[Tuple[pd.DataFrame, str]]) -> List[Any]:
+        """Standardize each file, across worker processes for large multi-file batches.
+        
+        Returns one (std_df, std_info) tuple or raised exception per file, in input order.
+        """
+        total_rows = sum(len(df) for df, _ in file_data_list)
+        
+        workers = min(len(file_data_list), os.cpu_count() or 1)
+        
+        if workers > 1 and total_rows >= PARALLEL_MIN_ROWS:
+            self.log(f"⚡ Parsing {len(file_data_list)} files ({total_rows} rows) on {workers} worker processes")
+            try:
+                # spawn: forking a threaded server process is unsafe
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    futures = [executor.submit(_standardize_file_in_worker, df, filename) for df, filename in file_data_list]
+                    results = []
+                    for future in futures:
+                        if future.exception():
+                            results.append(future.exception())
+                            continue
+                        result, logs = future.result()
+                        # Workers can't reach this process's debug callback; replay their logs in file order
+                        for message, category in logs:
+                            self.log(message, category)
+                        results.append(result)
+                    return results
+            except (OSError, RuntimeError) as e:
+                self.log(f"⚠️ Worker pool unavailable, parsing files in turn: {e}")
+        
+        results = []
+        for df, filename in file_data_list:
+            try:
+                results.append(self.standardize_name_dataframe(df, filename))
+            except Exception as e:
+                results.append(e)
+        return results
+    
     def get_name_standardization_summary(self, standardization_info_list: List[Dict]) -> Dict:
         """Generate name standardization summary"""
         total_records = 0
@@ -22,11 +22,15 @@ class USPSAddressValidator:
         'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
     }
     
-    def __init__(self, client_id: str, client_secret: str, debug_callback=None):
+    def __init__(self, client_id: str, client_secret: str, debug_callback=None,
+                 session: Optional[requests.Session] = None):
         self.client_id = client_id
         self.client_secret = client_secret
         self.debug_callback = debug_callback or (lambda msg: None)
         
+        # One keep-alive session for token and lookup calls, so repeat requests skip the TCP/TLS handshake
+        self.session = session or requests.Session()
+        
         # API endpoints
         self.auth_url = 'https://apis.usps.com/oauth2/v3/token'
         self.validate_url = 'https://apis.usps.com/addresses/v3/address'
@@ -79,7 +83,7 @@ class USPSAddressValidator:
             self._log(f"📤 POST {self.auth_url}")
             self._log("📤 Data: grant_type, client_id, client_secret, scope")
             
-            response = requests.post(
+            response = self.session.post(
                 self.auth_url,
                 headers=headers,
                 data=data,
@@ -127,14 +131,6 @@ class USPSAddressValidator:
                 'error': 'USPS API not configured'
             }
         
-        # Get token
-        access_token = self.get_access_token()
-        if not access_token:
-            return {
-                'success': False,
-                'error': 'Failed to get access token'
-            }
-        
         # Extract and validate address components
         street_address = address_data.get('street_address', '').strip()
         city = address_data.get('city', '').strip()
@@ -158,6 +154,14 @@ class USPSAddressValidator:
                 'error': error_msg
             }
         
+        # Get token (only once the address is complete, so blank rows never reach USPS)
+        access_token = self.get_access_token()
+        if not access_token:
+            return {
+                'success': False,
+                'error': 'Failed to get access token'
+            }
+        
         # Parse street address for apartment/unit
         street_parts = self._parse_street_address(street_address)
         self._log(f"📍 Parsed - Street: '{street_parts['street']}', Unit: '{street_parts['unit']}'")
@@ -192,7 +196,7 @@ class USPSAddressValidator:
             }
             
             # Use GET with query parameters (this is the fix!)
-            response = requests.get(
+            response = self.session.get(
                 self.validate_url,
                 headers=headers,
                 params=params,
@@ -403,7 +407,7 @@ class USPSAddressValidator:
     @staticmethod
     def validate_address_field(address: str, debug_callback=None) -> Tuple[List[str], List[str]]:
         """Validate street address with debug logging"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         errors = []
         warnings = []
         
@@ -434,7 +438,7 @@ class USPSAddressValidator:
             if debug_callback:
                 debug_callback("PO Box detected in address")
         
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
         if debug_callback:
             if errors:
                 debug_callback(f"Address validation completed with {len(errors)} errors ({duration_ms}ms)")
@@ -446,7 +450,7 @@ class USPSAddressValidator:
     @staticmethod
     def validate_city_field(city: str, debug_callback=None) -> Tuple[List[str], List[str]]:
         """Validate city with debug logging"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         errors = []
         warnings = []
         
@@ -465,7 +469,7 @@ class USPSAddressValidator:
         if not re.match(r"^[a-zA-Z\s\-'\.]+$", city):
             errors.append("City can only contain letters, spaces, hyphens, apostrophes, and periods")
         
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
         if debug_callback:
             debug_callback(f"City validation completed ({duration_ms}ms)")
         
@@ -474,7 +478,7 @@ class USPSAddressValidator:
     @staticmethod
     def validate_state_field(state: str, debug_callback=None) -> Tuple[List[str], List[str]]:
         """Validate state with debug logging"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         errors = []
         warnings = []
         
@@ -494,7 +498,7 @@ class USPSAddressValidator:
             if debug_callback:
                 debug_callback(f"Invalid state code provided: {state}")
         
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
         if debug_callback:
             debug_callback(f"State validation completed ({duration_ms}ms)")
         
@@ -503,7 +507,7 @@ class USPSAddressValidator:
     @staticmethod
     def validate_zip_code_field(zip_code: str, debug_callback=None) -> Tuple[List[str], List[str]]:
         """Validate ZIP code with debug logging"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         errors = []
         warnings = []
         
@@ -524,7 +528,7 @@ class USPSAddressValidator:
             if debug_callback:
                 debug_callback("Invalid ZIP code - all zeros")
         
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
         if debug_callback:
             debug_callback(f"ZIP validation completed ({duration_ms}ms)")
         
@@ -6,6 +6,21 @@ Enhanced Name Validator with US Census data and intelligent suggestions
 import re
 from typing import Dict, List
 
+try:
+    # C++ implementations of the same 0-100 scorers as fuzzywuzzy
+    from rapidfuzz import fuzz
+    from rapidfuzz.utils import default_process
+    FUZZY_MATCHING_AVAILABLE = True
+    # fuzzywuzzy's token_sort_ratio lower-cases and strips punctuation by default; rapidfuzz has to be asked
+    TOKEN_SORT_OPTIONS = {'processor': default_process}
+except ImportError:
+    try:
+        from fuzzywuzzy import fuzz
+        FUZZY_MATCHING_AVAILABLE = True
+        TOKEN_SORT_OPTIONS = {}
+    except ImportError:
+        FUZZY_MATCHING_AVAILABLE = False
+
 class EnhancedNameValidator:
     def __init__(self):
         self.min_length = 1
@@ -130,8 +145,7 @@ class EnhancedNameValidator:
                 })
         
         # 3. Fuzzy matching (if available)
-        try:
-            from fuzzywuzzy import fuzz
+        if FUZZY_MATCHING_AVAILABLE:
             for real_name in name_list:
                 if real_name == name_clean:
                     continue
@@ -139,10 +153,10 @@ class EnhancedNameValidator:
                 # Multiple similarity algorithms
                 ratio = fuzz.ratio(name_clean, real_name)
                 partial_ratio = fuzz.partial_ratio(name_clean, real_name)
-                token_sort = fuzz.token_sort_ratio(name_clean, real_name)
+                token_sort = fuzz.token_sort_ratio(name_clean, real_name, **TOKEN_SORT_OPTIONS)
                 
-                # Use the best score
-                best_score = max(ratio, partial_ratio, token_sort)
+                # Use the best score, on fuzzywuzzy's whole-number scale
+                best_score = round(max(ratio, partial_ratio, token_sort))
                 
                 if best_score > 75:  # Threshold for suggestions
                     suggestions.append({
@@ -150,7 +164,7 @@ class EnhancedNameValidator:
                         'confidence': best_score / 100.0,
                         'reason': 'fuzzy_match'
                     })
-        except ImportError:
+        else:
             # Fallback simple matching
             for real_name in name_list:
                 if real_name == name_clean:
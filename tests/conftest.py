@@ -0,0 +1,8 @@
+"""Shared pytest setup: import the package from src/ without installing it"""
+
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
@@ -0,0 +1,73 @@
+"""Concurrent USPS validation must keep the debug log on the calling thread"""
+
+import threading
+
+import pytest
+
+from name_address_validator.services import validation_service
+from name_address_validator.services.validation_service import EnhancedValidationService
+
+ADDRESSES = [
+    {'street_address': f'{n} Main St', 'city': 'Springfield', 'state': 'IL', 'zip_code': '62701'}
+    for n in range(1, 41)
+]
+
+
+class StubValidator:
+    """USPSAddressValidator stand-in that logs from whichever thread validates"""
+
+    def __init__(self, client_id, client_secret, debug_callback=None, session=None):
+        self.debug_callback = debug_callback
+
+    def is_configured(self):
+        return True
+
+    def get_access_token(self):
+        self.debug_callback("🔑 token")
+        return 'token'
+
+    def validate_address(self, address_data):
+        self.debug_callback(f"🏠 {address_data['street_address']}")
+        if address_data['street_address'].startswith('13 '):
+            raise ValueError('boom')
+        return {'success': True, 'deliverable': True, 'confidence': 1.0}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Service wired to the stub, with a callback that fails off the calling thread like st.session_state does"""
+    logs = []
+    caller = threading.current_thread()
+
+    def callback(message, category="SERVICE"):
+        if threading.current_thread() is not caller:
+            raise AttributeError('st.session_state has no attribute "debug_logs"')
+        logs.append((message, category))
+
+    monkeypatch.setattr(validation_service, 'load_usps_credentials', lambda: ('client-id', 'client-secret'))
+    monkeypatch.setattr(validation_service, 'USPSAddressValidator', StubValidator)
+    service = EnhancedValidationService(debug_callback=callback, address_concurrency=4)
+    logs.clear()
+    return service, logs
+
+
+def test_worker_logs_do_not_fail_lookups(service):
+    service, _ = service
+    results = service.validate_addresses_batch(ADDRESSES)
+
+    assert len(results) == len(ADDRESSES)
+    for address, result in zip(ADDRESSES, results):
+        if address['street_address'].startswith('13 '):
+            assert result == {'success': False, 'error': 'Address validation error: boom', 'deliverable': False}
+        else:
+            assert result['success'] and result['deliverable']
+
+
+def test_worker_logs_are_replayed_in_input_order(service):
+    service, logs = service
+    service.validate_addresses_batch(ADDRESSES)
+
+    lookups = [message for message, _ in logs if message.startswith('🏠 ') and not message.startswith('🏠 Batch')]
+    assert lookups == [f"🏠 {address['street_address']}" for address in ADDRESSES]
+    assert ("🔑 token", "SERVICE") in logs
+    assert all(category == "SERVICE" for _, category in logs)
@@ -13,7 +13,7 @@ project_root = Path(__file__).parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-def test_combined_address_fix():
+def run_combined_address_fix():
     """Test the complete fix end-to-end"""
     
     print("🧪 TESTING COMBINED ADDRESS FIX")
@@ -138,6 +138,10 @@ def test_combined_address_fix():
         traceback.print_exc()
         return False
 
+def test_combined_address_fix():
+    """Pytest entry point: the end-to-end check must pass"""
+    assert run_combined_address_fix()
+
 def main():
     """Run the complete test"""
     
@@ -145,7 +149,7 @@ def main():
     print("Testing that combined address parsing works correctly")
     print("=" * 60)
     
-    success = test_combined_address_fix()
+    success = run_combined_address_fix()
     
     print("\n" + "=" * 60)
     
@@ -0,0 +1,39 @@
+"""Address qualification results keep the qualified_data/disqualified_data keys alongside the masks"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from name_address_validator.services.validation_service import EnhancedValidationService
+
+SAMPLE_CSV_DIR = Path(__file__).resolve().parent.parent / "test_csv_files"
+
+
+@pytest.fixture(scope='module')
+def result():
+    files = [(pd.read_csv(path), path.name) for path in sorted(SAMPLE_CSV_DIR.glob('[0-9][1-9]_*.csv'))]
+    service = EnhancedValidationService(debug_callback=lambda message, category="SERVICE": None)
+    result = service.standardize_and_qualify_csv_files(files)
+    assert result['success']
+    return result
+
+
+def test_masked_keys_match_the_old_copies(result):
+    standardized_df = result['standardized_data']
+    qualified = standardized_df[standardized_df['us_qualified'] == True]
+    disqualified = standardized_df[standardized_df['us_qualified'] == False]
+
+    pd.testing.assert_frame_equal(result['qualified_data'], qualified)
+    pd.testing.assert_frame_equal(result['disqualified_data'], disqualified)
+    assert len(result['qualified_data']) == result['qualified_rows'] > 0
+    assert len(result['disqualified_data']) == result['disqualified_rows'] > 0
+
+
+def test_masked_keys_are_not_stored(result):
+    assert 'qualified_data' in result and 'disqualified_data' in result
+    assert result.get('qualified_data') is not None
+    assert 'qualified_data' not in result.keys()
+    assert 'missing' not in result and result.get('missing', 'default') == 'default'
+    with pytest.raises(KeyError):
+        result['missing']
@@ -0,0 +1,94 @@
+"""Tests for the precompiled column-name matching used by both standardizers"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from name_address_validator.utils.column_matching import compile_column_patterns, match_columns
+from name_address_validator.utils.address_standardizer import AddressFormatStandardizer
+from name_address_validator.utils.name_format_standardizer import NameFormatStandardizer
+
+
+def quiet(*args, **kwargs):
+    pass
+
+
+def loop_match(columns, column_mappings):
+    """The original nested-loop matching the helpers replaced"""
+    detected = {}
+    for standard_col, variations in column_mappings.items():
+        for variation in variations:
+            for actual_col in columns:
+                if actual_col.lower().strip() == variation:
+                    detected[standard_col] = actual_col
+                    break
+            if standard_col in detected:
+                break
+    return detected
+
+
+def match(columns, column_mappings):
+    pattern, variation_rank = compile_column_patterns(column_mappings)
+    return match_columns(columns, pattern, variation_rank, column_mappings)
+
+
+MAPPINGS = {
+    'first_name': ['first_name', 'first', 'fname'],
+    'last_name': ['last_name', 'last', 'surname'],
+    'zip_code': ['zip_code', 'zip', 'postal.code'],
+}
+
+
+def test_alias_priority_follows_mapping_order():
+    """An earlier variation wins even when a later one appears first in the frame"""
+    assert match(['fname', 'first', 'First_Name'], MAPPINGS) == {'first_name': 'First_Name'}
+    assert match(['surname', 'last'], MAPPINGS) == {'last_name': 'last'}
+
+
+def test_first_column_wins_among_equal_variations():
+    assert match(['ZIP', 'zip '], MAPPINGS) == {'zip_code': 'ZIP'}
+
+
+def test_case_and_surrounding_spaces_are_ignored():
+    assert match(['  FIRST ', 'Last_Name\t', ' Zip_Code'], MAPPINGS) == {
+        'first_name': '  FIRST ', 'last_name': 'Last_Name\t', 'zip_code': ' Zip_Code'
+    }
+
+
+def test_unmatched_and_partial_columns_are_skipped():
+    """Only whole-name matches count; regex metacharacters in aliases are literal"""
+    assert match(['first name', 'firstname_x', 'xfirst', 'postalXcode', 'notes'], MAPPINGS) == {}
+    assert match(['postal.code'], MAPPINGS) == {'zip_code': 'postal.code'}
+    assert match([], MAPPINGS) == {}
+
+
+def test_result_keys_follow_mapping_order():
+    assert list(match(['zip', 'last', 'first'], MAPPINGS)) == ['first_name', 'last_name', 'zip_code']
+
+
+@pytest.mark.parametrize('column_mappings', [
+    AddressFormatStandardizer(debug_callback=quiet).column_mappings,
+    NameFormatStandardizer(debug_callback=quiet).name_column_mappings,
+], ids=['address', 'name'])
+@pytest.mark.parametrize('columns', [
+    ['first_name', 'last_name', 'street_address', 'city', 'state', 'zip_code'],
+    ['First', 'LNAME', 'Address', 'Address1', 'Town', 'ST', 'Postal_Code', 'ZIP'],
+    ['name', 'Full_Name', 'customer_name', 'Surname', 'given_name', 'fname'],
+    [' Street ', 'STREET1', 'mailing_address', 'City ', 'province', 'zip5'],
+    ['notes', 'id', 'phone', 'e-mail'],
+])
+def test_matches_original_loop(column_mappings, columns):
+    """Same mapping as the nested loop for the real alias tables"""
+    assert match(columns, column_mappings) == loop_match(columns, column_mappings)
+
+
+SAMPLE_CSV_DIR = Path(__file__).resolve().parent.parent / "test_csv_files"
+
+
+@pytest.mark.parametrize('csv_path', sorted(SAMPLE_CSV_DIR.glob('*.csv')), ids=lambda path: path.name)
+def test_sample_csv_headers_match_original_loop(csv_path):
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    for standardizer in (AddressFormatStandardizer(debug_callback=quiet), NameFormatStandardizer(debug_callback=quiet)):
+        column_mappings = getattr(standardizer, 'column_mappings', None) or standardizer.name_column_mappings
+        assert match(columns, column_mappings) == loop_match(columns, column_mappings)
@@ -0,0 +1,64 @@
+"""CSV downloads must produce the same bytes as DataFrame.to_csv; download bytes are built once per frame"""
+
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from name_address_validator import app
+
+SAMPLE_CSV_DIR = Path(__file__).resolve().parent.parent / "test_csv_files"
+
+EDGE_FRAMES = {
+    'mixed_types': pd.DataFrame({
+        'text': ['plain', 'a,b', 'say "hi"', '', None, 'line\nbreak', ' padded ', 'cr\r'],
+        'int': [1, 2, 3, 4, 5, 6, 7, 8],
+        'float': [1.0, 0.1, 1e16, np.nan, 1 / 3, -0.0, 1e-5, 123456789012.5],
+        'bool': [True, False] * 4,
+        'category': pd.Categorical(['x', 'y,z', None, 'x', 'x', 'y,z', 'x', 'x']),
+        'nullable_int': pd.array([1, None, 3, 4, 5, 6, 7, 8], dtype='Int64'),
+    }),
+    'single_column_blanks': pd.DataFrame({'only': ['a', '', None, 'b']}),
+    'no_rows': pd.DataFrame({'a': [], 'b': []}),
+    'string_dtype': pd.DataFrame({'s': pd.array(['a', None, 'c,d'], dtype='string')}),
+    'datetimes': pd.DataFrame({
+        'midnight': pd.to_datetime(['2023-01-05', '2023-01-06', None, '2023-02-01']),
+        'with_time': pd.to_datetime(['2023-01-05 10:30:00', '2023-01-06 00:00:00', None, '2023-02-01 00:00:01']),
+        'with_tz': pd.to_datetime(['2023-01-05', '2023-01-06', None, '2023-02-01']).tz_localize('UTC'),
+    }),
+    'float32': pd.DataFrame({'f': np.array([0.1, 123456.789, np.nan, 1 / 3], dtype=np.float32)}),
+    'mixed_object': pd.DataFrame({'mixed': [1, 'two', 3.5, None]}),
+}
+
+
+FRAMES = ([pytest.param(pd.read_csv(path), id=path.name) for path in sorted(SAMPLE_CSV_DIR.glob('*.csv'))]
+          + [pytest.param(df, id=name) for name, df in EDGE_FRAMES.items()])
+
+
+@pytest.mark.parametrize('df', FRAMES)
+@pytest.mark.parametrize('chunksize', [3, 10_000])
+def test_download_matches_to_csv(df, chunksize):
+    assert app.dataframe_to_csv_bytes(df, chunksize=chunksize) == df.to_csv(index=False).encode('utf-8')
+
+
+@pytest.mark.parametrize('df', FRAMES)
+def test_round_trip(df):
+    """Reading the download back gives the same frame as reading to_csv's output"""
+    expected = pd.read_csv(io.StringIO(df.to_csv(index=False)))
+    pd.testing.assert_frame_equal(pd.read_csv(io.BytesIO(app.dataframe_to_csv_bytes(df))), expected)
+
+
+def test_parquet_download_is_cached(monkeypatch):
+    pytest.importorskip("pyarrow")
+    calls = []
+    build = app.dataframe_to_parquet_bytes
+    monkeypatch.setattr(app, 'dataframe_to_parquet_bytes', lambda df, metadata=None: calls.append(1) or build(df, metadata))
+    df = pd.DataFrame({'name': ['cached-parquet-test'], 'value': [1]})
+    metadata = {b'pipeline_summary': b'{}'}
+
+    first = app.cached_parquet_bytes(df, metadata)
+    assert app.cached_parquet_bytes(df.copy(), dict(metadata)) == first
+    assert len(calls) == 1
+    assert pd.read_parquet(io.BytesIO(first)).equals(df)
@@ -0,0 +1,29 @@
+"""Uploaded CSVs must parse to the same DataFrame as pd.read_csv"""
+
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+from name_address_validator import app
+
+SAMPLE_CSV_DIR = Path(__file__).resolve().parent.parent / "test_csv_files"
+
+EDGE_UPLOADS = {
+    'duplicate_headers': b'a,a,b\n1,2,x\n3,4,y\n',
+    'blank_header': b'first_name,,zip_code\nJohn,1,62701\nMary,2,\n',
+    'iso_dates': b'name,joined,seen_at,at\nJohn,2023-01-05,2023-01-05 10:30,10:30:00\nMary,,,\n',
+    'nullable_ints': b'zip_code,name\n62701,Bob\n,Ann\n',
+    'quoted': b'name,note\n"Smith, John","say ""hi"""\n',
+}
+
+UPLOADS = ([pytest.param(path.read_bytes(), id=path.name) for path in sorted(SAMPLE_CSV_DIR.glob('*.csv'))]
+           + [pytest.param(data, id=name) for name, data in EDGE_UPLOADS.items()])
+
+
+@pytest.mark.parametrize('file_bytes', UPLOADS)
+def test_upload_parses_like_read_csv(file_bytes):
+    parsed = app._parse_csv_cached(f"test-{hash(file_bytes)}", 'upload.csv', file_bytes)
+    pd.testing.assert_frame_equal(parsed, pd.read_csv(io.BytesIO(file_bytes)))
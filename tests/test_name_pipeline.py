@@ -0,0 +1,75 @@
+"""The fused name pipeline must return what the combined (parse, preview, validate) pipeline returns"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from name_address_validator.services.validation_service import EnhancedValidationService
+from name_address_validator.utils import name_format_standardizer
+
+SAMPLE_CSV_DIR = Path(__file__).resolve().parent.parent / "test_csv_files"
+
+
+def sample_files():
+    return [(pd.read_csv(path), path.name) for path in sorted(SAMPLE_CSV_DIR.glob('[0-9][1-9]_*.csv'))]
+
+
+@pytest.fixture(scope='module')
+def service():
+    return EnhancedValidationService(debug_callback=lambda message, category="SERVICE": None)
+
+
+def assert_same_pipeline_result(combined, fused):
+    assert combined['success'] and fused['success']
+    assert fused['summary'] == combined['summary']
+    for key in ('records', 'summary', 'total_records', 'processed_records', 'successful_validations',
+                'failed_validations', 'has_suggestions'):
+        assert fused['validation'][key] == combined['validation'][key], key
+    # Samples hold NaN for missing values, so compare their text
+    assert str(fused['preview']) == str(combined['preview'])
+    standardization = {k: v for k, v in combined['standardization'].items()
+                       if k not in ('standardized_data', 'name_valid_mask', 'processing_time_ms')}
+    assert {k: v for k, v in fused['standardization'].items() if k != 'processing_time_ms'} == standardization
+
+
+@pytest.mark.parametrize('max_records', [None, 7])
+def test_fused_matches_combined_pipeline(service, max_records):
+    combined = service.process_complete_name_validation_pipeline(sample_files(), max_records=max_records)
+    fused = service.process_name_pipeline_fused(sample_files(), max_records=max_records)
+
+    assert_same_pipeline_result(combined, fused)
+
+
+def test_fused_pipeline_reports_failed_files(service):
+    fused = service.process_name_pipeline_fused(sample_files() + [('not a dataframe', 'broken.csv')], total_source_rows=0)
+    serial = service.process_name_pipeline_fused(sample_files(), total_source_rows=0)
+
+    assert fused['success']
+    assert fused['standardization']['standardization_info'][-1]['status'] == 'failed'
+    assert fused['standardization']['summary']['failed_files'] == 1
+    assert fused['validation']['records'] == serial['validation']['records']
+
+
+def test_fused_pipeline_parses_through_the_standardizer_fan_out(service, monkeypatch):
+    calls = []
+    standardize_files = service.name_standardizer._standardize_files
+    monkeypatch.setattr(service.name_standardizer, '_standardize_files',
+                        lambda file_data_list: calls.append(len(file_data_list)) or standardize_files(file_data_list))
+
+    fused = service.process_name_pipeline_fused(sample_files())
+
+    assert fused['success'] and calls == [len(sample_files())]
+    sources = {record['source_file'] for record in fused['validation']['records']}
+    assert sources <= {file_name for _, file_name in sample_files()}
+
+
+def test_fused_pipeline_on_worker_processes(service, monkeypatch):
+    serial = service.process_name_pipeline_fused(sample_files())
+    monkeypatch.setattr(name_format_standardizer, 'PARALLEL_MIN_ROWS', 0)
+    monkeypatch.setattr(name_format_standardizer.os, 'cpu_count', lambda: 2)
+    parallel = service.process_name_pipeline_fused(sample_files())
+
+    assert parallel['summary'] == serial['summary']
+    assert parallel['validation']['records'] == serial['validation']['records']
+    assert str(parallel['preview']) == str(serial['preview'])
@@ -0,0 +1,56 @@
+"""Multi-process name parsing must give the serial results and keep the debug log"""
+
+import pandas as pd
+import pytest
+
+from name_address_validator.utils import name_format_standardizer
+from name_address_validator.utils.name_format_standardizer import NameFormatStandardizer
+
+FILES = [
+    (pd.DataFrame({'full_name': ['John Smith', 'Smith, Mary', 'Dr. Anna Lee Jr', 'X', '']}), 'a.csv'),
+    (pd.DataFrame({'first_name': ['Jane', 'Jon', None], 'last_name': ['Doe', 'Smyth', 'Lee']}), 'b.csv'),
+]
+
+
+def standardize(file_data_list):
+    logs = []
+    standardizer = NameFormatStandardizer(debug_callback=lambda message, category="NAME_STANDARDIZER": logs.append((message, category)))
+    logs.clear()
+    return standardizer._standardize_files(file_data_list), logs
+
+
+@pytest.fixture
+def force_workers(monkeypatch):
+    """Take the process-pool path even for tiny inputs on a single-CPU machine"""
+    monkeypatch.setattr(name_format_standardizer, 'PARALLEL_MIN_ROWS', 0)
+    monkeypatch.setattr(name_format_standardizer.os, 'cpu_count', lambda: 2)
+
+
+def test_worker_results_match_serial(force_workers, monkeypatch):
+    parallel, parallel_logs = standardize(FILES)
+    monkeypatch.setattr(name_format_standardizer, 'PARALLEL_MIN_ROWS', float('inf'))
+    serial, serial_logs = standardize(FILES)
+    
+    assert any('worker processes' in message for message, _ in parallel_logs)
+    for (parallel_df, parallel_info), (serial_df, serial_info) in zip(parallel, serial):
+        pd.testing.assert_frame_equal(parallel_df, serial_df)
+        assert parallel_info == serial_info
+
+
+def test_worker_logs_are_replayed_in_file_order(force_workers, monkeypatch):
+    _, parallel_logs = standardize(FILES)
+    monkeypatch.setattr(name_format_standardizer, 'PARALLEL_MIN_ROWS', float('inf'))
+    _, serial_logs = standardize(FILES)
+    
+    # Everything the serial run logs while parsing shows up, in order, after the pool message
+    replayed = parallel_logs[[i for i, (message, _) in enumerate(parallel_logs) if 'worker processes' in message][0] + 1:]
+    assert replayed == serial_logs
+    assert any('a.csv' in message for message, _ in replayed)
+    assert any('b.csv' in message for message, _ in replayed)
+
+
+def test_worker_failure_is_returned_with_its_logs(force_workers):
+    results, logs = standardize([FILES[0], ('not a dataframe', 'broken.csv')])
+    
+    assert isinstance(results[1], Exception)
+    assert any('broken.csv' in message for message, _ in logs)
@@ -0,0 +1,42 @@
+"""Result records must become the same DataFrame pandas would build, and shrinking it must keep every value"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+from name_address_validator import app
+
+RECORDS = {
+    'mixed_int_float': [{'c': 1}, {'c': 0.5}, {'c': None}],
+    'big_int': [{'c': 1}, {'c': 2 ** 63}],
+    'optional_columns': [{'row': 1, 'name': 'a'}, {'row': 2, 'name': 'b', 'suggestion': 'x (90.0%)'}],
+    'mixed_types': [{'c': 'a'}, {'c': 1}],
+    'nullable_bool': [{'c': True}, {'c': None}],
+}
+
+
+@pytest.mark.parametrize('records', list(RECORDS.values()), ids=list(RECORDS))
+def test_records_to_dataframe_matches_pandas(records):
+    pd.testing.assert_frame_equal(app.records_to_dataframe(records), pd.DataFrame(records))
+
+
+def test_records_to_dataframe_keeps_values():
+    assert app.records_to_dataframe(RECORDS['mixed_int_float'])['c'].tolist()[:2] == [1.0, 0.5]
+    assert app.records_to_dataframe(RECORDS['big_int'])['c'].tolist() == [1, 2 ** 63]
+
+
+def test_shrink_dataframe_keeps_float_values():
+    df = pd.DataFrame({
+        'inexact': [0.1, 123456.789, None],
+        'exact': [0.5, 2.0, None],
+        'ints': [1, 2, 3],
+        'nullable': pd.array([0.1, None, 0.25], dtype='Float64'),
+    })
+    expected = df.copy()
+
+    shrunk = app.shrink_dataframe(df)
+
+    assert shrunk['inexact'].dtype == 'float64' and shrunk['nullable'].dtype == 'Float64'
+    assert shrunk['exact'].dtype == 'float32' and shrunk['ints'].dtype == 'int8'
+    pd.testing.assert_frame_equal(shrunk, expected, check_dtype=False)
+    assert shrunk.to_csv(index=False) == expected.to_csv(index=False)
@@ -0,0 +1,191 @@
+"""Vectorized address and name batch validation must give the per-row results"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from name_address_validator.services import validation_service
+from name_address_validator.services.validation_service import EnhancedValidationService
+
+SAMPLE_CSV_DIR = Path(__file__).resolve().parent.parent / "test_csv_files"
+
+# Duplicate pairs, empty and one-sided names, padding, missing values and a name the validator rejects
+EDGE_NAMES = pd.DataFrame({
+    'first_name': ['John', 'John', ' John ', '', None, 'Mary', '', 'Jon', 'X1', 'mary'],
+    'last_name': ['Smith', 'Smith', 'Smith', '', None, '', 'Brown', 'Smyth', '!!', 'Brown'],
+    'middle_name': ['A', None, 'A', '', '', 'Lee', '', '', '', ''],
+    'title': ['Dr.', '', '', '', None, '', '', 'Mr.', '', ''],
+    'source_file': pd.Categorical(['a.csv'] * 5 + ['b.csv'] * 5),
+})
+
+
+class StubValidator:
+    """Deterministic USPSAddressValidator stand-in: ZIP codes starting with an even digit are deliverable"""
+
+    def __init__(self, client_id, client_secret, debug_callback=None, session=None):
+        pass
+
+    def is_configured(self):
+        return True
+
+    def get_access_token(self):
+        return 'token'
+
+    def validate_address(self, address_data):
+        zip_code = address_data['zip_code']
+        if not zip_code[:1].isdigit():
+            return {'success': False, 'error': 'Invalid ZIP', 'deliverable': False}
+        if int(zip_code[0]) % 2:
+            return {'success': True, 'deliverable': False, 'confidence': 0.4}
+        return {'success': True, 'deliverable': True, 'confidence': 0.9,
+                'standardized': {**address_data, 'street_address': address_data['street_address'].upper()}}
+
+
+@pytest.fixture(scope='module')
+def service():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(validation_service, 'load_usps_credentials', lambda: ('client-id', 'client-secret'))
+        monkeypatch.setattr(validation_service, 'USPSAddressValidator', StubValidator)
+        yield EnhancedValidationService(debug_callback=lambda message, category="SERVICE": None)
+
+
+def sample_files():
+    return [(pd.read_csv(path), path.name) for path in sorted(SAMPLE_CSV_DIR.glob('[0-9][1-9]_*.csv'))]
+
+
+def text(value) -> str:
+    return '' if pd.isna(value) else str(value).strip()
+
+
+def per_row_address_records(service, qualified_df):
+    """validate_single_record on each qualified row, laid out as validate_qualified_addresses records"""
+    records = []
+    for i, row in enumerate(qualified_df.to_dict('records'), 1):
+        fields = {col: text(row.get(col)) for col in ('first_name', 'last_name', 'street_address', 'city', 'state', 'zip_code')}
+        fields['state'] = fields['state'].upper()
+        result = service.validate_single_record(**fields)
+        name_result, address_result = result['name_result'], result['address_result']
+        standardized = address_result.get('standardized') or {}
+        records.append({
+            'row': i,
+            'source_file': row.get('source_file', 'unknown'),
+            'first_name': fields['first_name'],
+            'last_name': fields['last_name'],
+            'original_address': f"{fields['street_address']}, {fields['city']}, {fields['state']} {fields['zip_code']}",
+            'name_status': 'Valid' if name_result['valid'] else 'Invalid',
+            'deliverable': bool(address_result.get('deliverable', False)),
+            'standardized_address': (f"{standardized.get('street_address', '')}, {standardized.get('city', '')}, "
+                                     f"{standardized.get('state', '')} {standardized.get('zip_code', '')}" if standardized else ''),
+            'overall_valid': result['overall_valid'],
+            'overall_confidence': result['overall_confidence'],
+            'error': address_result.get('error', '')
+        })
+    return records
+
+
+def per_row_name_records(service, parsed_names_df, include_suggestions):
+    """The original one-validation-per-row batch loop (missing values read as '')"""
+    records = []
+    summary = {'common_first_names': 0, 'common_last_names': 0, 'uncommon_names': 0, 'suggestions_provided': 0}
+    for i, row in enumerate(parsed_names_df.to_dict('records'), 1):
+        names = {col: text(row.get(col)) for col in ('first_name', 'last_name', 'middle_name', 'title', 'suffix')}
+        validation_result = service.name_validator.validate(names['first_name'], names['last_name'])
+        record = {
+            'row': i,
+            'source_file': row.get('source_file', 'unknown'),
+            **names,
+            'name_status': 'Valid' if validation_result['valid'] else 'Invalid',
+            'confidence': f"{validation_result['confidence']:.1%}",
+            'errors': '; '.join(validation_result.get('errors', [])),
+            'warnings': '; '.join(validation_result.get('warnings', []))
+        }
+        suggestions = validation_result.get('suggestions') if include_suggestions else None
+        for side in ('first_name', 'last_name'):
+            if suggestions and suggestions.get(side):
+                top = suggestions[side][0]
+                record[f'{side}_suggestion'] = f"{top['suggestion']} ({top['confidence']:.1%})"
+                summary['suggestions_provided'] += 1
+        analysis = validation_result.get('analysis', {})
+        common_first = bool(analysis.get('first_name', {}).get('is_common'))
+        common_last = bool(analysis.get('last_name', {}).get('is_common'))
+        summary['common_first_names'] += common_first
+        summary['common_last_names'] += common_last
+        summary['uncommon_names'] += not common_first and not common_last
+        records.append(record)
+    return records, summary
+
+
+def test_qualified_addresses_match_per_row_validation(service):
+    standardization_result = service.standardize_and_qualify_csv_files(sample_files())
+    qualified_df = standardization_result['qualified_data']
+    # The samples mix qualified and disqualified rows; only the qualified ones are validated
+    assert 0 < len(qualified_df) < len(standardization_result['standardized_data'])
+
+    result = service.validate_qualified_addresses(standardization_result)
+
+    expected = per_row_address_records(service, qualified_df)
+    assert result['records'] == expected
+    assert result['total_records'] == result['processed_records'] == len(expected)
+    assert result['successful_validations'] == sum(record['overall_valid'] for record in expected)
+    assert 0 < result['successful_validations'] < len(expected)
+
+
+def test_qualified_addresses_edge_rows_and_max_records(service):
+    standardized_df = EDGE_NAMES[['first_name', 'last_name', 'source_file']].assign(
+        street_address=[' 1 Main St', '1 Main St', None, '2 Oak Ave', '3 Elm St', '', '4 Pine Rd', '5 Ash Ln', '6 Fir Ct', '7 Yew Dr'],
+        city='Springfield',
+        state=['il', 'IL', 'IL', ' ny', 'NY', 'NY', 'CA', 'CA', None, 'TX'],
+        zip_code=['62701', '62701', '12345', '10001', '', '40001', '90210', 'abc', '30301', '75001'],
+        us_qualified=[True, True, False, True, True, True, False, True, True, True],
+    )
+    standardization_result = {
+        'standardized_data': standardized_df,
+        'qualified_mask': standardized_df['us_qualified'].to_numpy(dtype=bool),
+    }
+
+    result = service.validate_qualified_addresses(standardization_result)
+    assert result['records'] == per_row_address_records(service, standardized_df[standardized_df['us_qualified']])
+
+    limited = service.validate_qualified_addresses(standardization_result, max_records=3)
+    assert limited['records'] == result['records'][:3]
+
+
+def test_name_pair_codes_number_distinct_pairs_in_first_seen_order():
+    first_names = np.array(['John', 'John', 'Mary', '', 'John', '', 'Mary'], dtype=object)
+    last_names = np.array(['Smith', 'Smith', 'Smith', '', 'Brown', '', 'Smith'], dtype=object)
+
+    pair_codes, pairs = EnhancedValidationService._name_pair_codes(first_names, last_names)
+
+    assert pairs == [('John', 'Smith'), ('Mary', 'Smith'), ('', ''), ('John', 'Brown')]
+    assert pair_codes.tolist() == [0, 0, 1, 2, 3, 2, 1]
+    assert [pairs[code] for code in pair_codes] == list(zip(first_names, last_names))
+
+
+def test_name_batch_columns_read_missing_values_and_columns_as_empty():
+    columns = EnhancedValidationService._name_batch_columns(EDGE_NAMES)
+
+    assert columns['first_name'].tolist() == ['John', 'John', 'John', '', '', 'Mary', '', 'Jon', 'X1', 'mary']
+    assert columns['suffix'].tolist() == [''] * len(EDGE_NAMES)
+    assert columns['source_file'].tolist() == ['a.csv'] * 5 + ['b.csv'] * 5
+    assert EnhancedValidationService._name_batch_columns(EDGE_NAMES[['first_name']])['source_file'].tolist() == ['unknown'] * len(EDGE_NAMES)
+
+
+@pytest.mark.parametrize('include_suggestions', [True, False])
+@pytest.mark.parametrize('source', ['samples', 'edge_names'])
+def test_name_batch_matches_per_row_validation(service, source, include_suggestions):
+    if source == 'samples':
+        parsed_names_df = service.standardize_and_parse_names_from_csv(sample_files())['standardized_data']
+    else:
+        parsed_names_df = EDGE_NAMES
+
+    result = service._validate_name_batch_records(service._name_batch_columns(parsed_names_df),
+                                                  include_suggestions=include_suggestions)
+
+    expected_records, expected_summary = per_row_name_records(service, parsed_names_df, include_suggestions)
+    assert result['records'] == expected_records
+    assert result['summary'] == expected_summary
+    assert result['processed_records'] == len(expected_records)
+    assert result['successful_validations'] == sum(record['name_status'] == 'Valid' for record in expected_records)
+    assert result['has_suggestions'] == (expected_summary['suggestions_provided'] > 0)